@@ -3,10 +3,70 @@ Django admin configuration for integration models.
 """
 
 from django.contrib import admin
+from django.db import connections
+from django.db.models import Func, TextField
+from django.db.models.functions import Substr
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from django.utils import timezone
 from datetime import timedelta
+from functools import lru_cache
 from .models import IntegrationLog, IntegrationSettings
+from .partitions import drop_partitions_before
+
+
+# Maximum rows removed per DELETE by the delete_old_logs action
+DELETE_BATCH_SIZE = 10000
+
+# Badge markup is constant per value, so build it once instead of per row
+BADGE_TEMPLATE = (
+    '<span style="background-color: {}; color: white; padding: 2px 6px; '
+    'border-radius: 3px; font-size: 11px;">{}</span>'
+)
+
+STATUS_COLORS = {
+    IntegrationLog.Status.SUCCESS: '#28a745',  # Green
+    IntegrationLog.Status.FAILED: '#dc3545',   # Red
+    IntegrationLog.Status.PENDING: '#ffc107',  # Yellow
+    IntegrationLog.Status.RETRYING: '#17a2b8'  # Blue
+}
+STATUS_BADGE_HTML = {
+    status: mark_safe(BADGE_TEMPLATE.format(color, status.label.upper()))
+    for status, color in STATUS_COLORS.items()
+}
+DEFAULT_BADGE_COLOR = '#6c757d'
+
+ENABLED_BADGE_HTML = mark_safe(BADGE_TEMPLATE.format('#28a745', 'ENABLED'))
+DISABLED_BADGE_HTML = mark_safe(BADGE_TEMPLATE.format('#dc3545', 'DISABLED'))
+MOCK_BADGE_HTML = mark_safe(BADGE_TEMPLATE.format('#17a2b8', 'MOCK'))
+LIVE_BADGE_HTML = mark_safe(BADGE_TEMPLATE.format('#28a745', 'LIVE'))
+
+# Opening tag per response-time bucket; only the integer value varies per row
+RESPONSE_TIME_OPEN = '<span style="color: {}; font-weight: bold;">'
+FAST_RESPONSE_OPEN = RESPONSE_TIME_OPEN.format('#28a745')    # Green - fast
+MEDIUM_RESPONSE_OPEN = RESPONSE_TIME_OPEN.format('#ffc107')  # Yellow - medium
+SLOW_RESPONSE_OPEN = RESPONSE_TIME_OPEN.format('#dc3545')    # Red - slow
+
+# (exclusive upper bound in ms, opening tag), checked in order
+RESPONSE_TIME_BUCKETS = (
+    (100, FAST_RESPONSE_OPEN),
+    (500, MEDIUM_RESPONSE_OPEN),
+    (float('inf'), SLOW_RESPONSE_OPEN),
+)
+
+
+@lru_cache(maxsize=2048)
+def response_time_html(response_time_ms: int):
+    """Colored response time markup; the same few values repeat across rows."""
+    opening = next(tag for limit, tag in RESPONSE_TIME_BUCKETS if response_time_ms < limit)
+    # response_time_ms is an integer column, so there is nothing to escape
+    return mark_safe(f'{opening}{response_time_ms} ms</span>')
+
+
+class JSONBPretty(Func):
+    """PostgreSQL's jsonb_pretty(), which formats JSON in C instead of Python."""
+    function = 'jsonb_pretty'
+    output_field = TextField()
 
 
 @admin.register(IntegrationLog)
@@ -34,8 +94,8 @@ class IntegrationLogAdmin(admin.ModelAdmin):
         'recipient',
         'subject',
         'error_message',
-        'task_id',
-        'project_id'
+        'task__id',
+        'project__id'
     ]
     
     readonly_fields = [
@@ -49,7 +109,7 @@ class IntegrationLogAdmin(admin.ModelAdmin):
             'fields': ['service', 'event_type', 'status', 'recipient', 'subject']
         }),
         ('Related Objects', {
-            'fields': ['task_id', 'project_id', 'organization_id']
+            'fields': ['task', 'project', 'organization']
         }),
         ('Integration Data', {
             'fields': ['request_data', 'response_data', 'error_message'],
@@ -65,74 +125,113 @@ class IntegrationLogAdmin(admin.ModelAdmin):
         })
     ]
     
+    raw_id_fields = ['task', 'project', 'organization']
+    
     ordering = ['-created_at']
     date_hierarchy = 'created_at'
     
     def status_badge(self, obj):
         """Display status with colored badge."""
-        colors = {
-            'success': '#28a745',  # Green
-            'failed': '#dc3545',   # Red
-            'pending': '#ffc107',  # Yellow
-            'retrying': '#17a2b8'  # Blue
-        }
-        color = colors.get(obj.status, '#6c757d')
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 2px 6px; border-radius: 3px; font-size: 11px;">{}</span>',
-            color,
-            obj.status.upper()
-        )
+        badge = STATUS_BADGE_HTML.get(obj.status)
+        if badge is None:
+            # Unknown status: escape it like any other user-visible value
+            badge = format_html(BADGE_TEMPLATE, DEFAULT_BADGE_COLOR, str(obj.get_status_display()).upper())
+        return badge
     status_badge.short_description = 'Status'
     
+    # Columns the change list actually renders; the JSON payloads and error
+    # text are only needed on the change form
+    changelist_fields = [
+        'id',
+        'created_at',
+        'service',
+        'event_type',
+        'status',
+        'recipient',
+        'response_time_ms'
+    ]
+    
+    def get_queryset(self, request):
+        """Fetch only the list columns (and a trimmed subject) on the change list."""
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        url_prefix = f'{self.opts.app_label}_{self.opts.model_name}'
+        if match and match.url_name == f'{url_prefix}_changelist':
+            # One character past the preview length tells us whether to add '...'
+            queryset = queryset.only(*self.changelist_fields).annotate(
+                subject_short=Substr('subject', 1, 51)
+            )
+        elif (match and match.url_name == f'{url_prefix}_change'
+                and connections[queryset.db].vendor == 'postgresql'):
+            # Pretty-print the response payload in the same query that loads the row
+            queryset = queryset.annotate(response_data_pretty=JSONBPretty('response_data'))
+        return queryset
+    
+    def formatted_response_data(self, obj):
+        """Pretty-formatted JSON response, formatted by the database when possible."""
+        if not obj.response_data:
+            return "No response data"
+        pretty = getattr(obj, 'response_data_pretty', None)
+        return pretty if pretty is not None else obj.formatted_response_data
+    formatted_response_data.short_description = 'Formatted response data'
+    
     def subject_preview(self, obj):
         """Show truncated subject/message."""
-        if obj.subject:
-            return obj.subject[:50] + ('...' if len(obj.subject) > 50 else '')
+        subject = getattr(obj, 'subject_short', None)
+        if subject is None:
+            subject = obj.subject
+        if subject:
+            return subject[:50] + ('...' if len(subject) > 50 else '')
         return '-'
     subject_preview.short_description = 'Subject/Message'
     
     def response_time_display(self, obj):
         """Display response time with formatting."""
         if obj.response_time_ms is not None:
-            if obj.response_time_ms < 100:
-                color = '#28a745'  # Green - fast
-            elif obj.response_time_ms < 500:
-                color = '#ffc107'  # Yellow - medium
-            else:
-                color = '#dc3545'  # Red - slow
-            
-            return format_html(
-                '<span style="color: {}; font-weight: bold;">{} ms</span>',
-                color,
-                obj.response_time_ms
-            )
+            return response_time_html(int(obj.response_time_ms))
         return '-'
     response_time_display.short_description = 'Response Time'
     
-    def get_queryset(self, request):
-        """Optimize queryset for admin display."""
-        return super().get_queryset(request).select_related()
-    
     actions = ['mark_as_successful', 'mark_as_failed', 'delete_old_logs']
     
     def mark_as_successful(self, request, queryset):
         """Bulk action to mark logs as successful."""
-        updated = queryset.update(status='success')
+        updated = queryset.update(status=IntegrationLog.Status.SUCCESS)
         self.message_user(request, f'Marked {updated} logs as successful.')
     mark_as_successful.short_description = 'Mark selected logs as successful'
     
     def mark_as_failed(self, request, queryset):
         """Bulk action to mark logs as failed."""
-        updated = queryset.update(status='failed')
+        updated = queryset.update(status=IntegrationLog.Status.FAILED)
         self.message_user(request, f'Marked {updated} logs as failed.')
     mark_as_failed.short_description = 'Mark selected logs as failed'
     
     def delete_old_logs(self, request, queryset):
         """Delete logs older than 30 days."""
         thirty_days_ago = timezone.now() - timedelta(days=30)
-        old_logs = queryset.filter(created_at__lt=thirty_days_ago)
-        count = old_logs.count()
-        old_logs.delete()
+        
+        # Acting on every log ("select all", no filters): whole expired months
+        # can go as partition DDL instead of row deletes
+        partitions = 0
+        if not queryset.query.where:
+            partitions = drop_partitions_before(thirty_days_ago, using=queryset.db)
+        
+        old_pks = queryset.filter(created_at__lt=thirty_days_ago).values('pk')
+        
+        # Nothing references IntegrationLog, so skip the collector and issue
+        # DELETE ... WHERE id IN (SELECT id ... LIMIT n) until a short batch;
+        # the ids never leave the database and each transaction stays short
+        count = 0
+        while True:
+            deleted = IntegrationLog.objects.filter(
+                pk__in=old_pks[:DELETE_BATCH_SIZE]
+            )._raw_delete(queryset.db)
+            count += deleted
+            if deleted < DELETE_BATCH_SIZE:
+                break
+        
+        if partitions:
+            self.message_user(request, f'Dropped {partitions} monthly log partitions older than 30 days.')
         self.message_user(request, f'Deleted {count} logs older than 30 days.')
     delete_old_logs.short_description = 'Delete logs older than 30 days'
 
@@ -175,26 +274,12 @@ class IntegrationSettingsAdmin(admin.ModelAdmin):
     
     def status_badge(self, obj):
         """Display enabled/disabled status with badge."""
-        if obj.is_enabled:
-            return format_html(
-                '<span style="background-color: #28a745; color: white; padding: 2px 6px; border-radius: 3px; font-size: 11px;">ENABLED</span>'
-            )
-        else:
-            return format_html(
-                '<span style="background-color: #dc3545; color: white; padding: 2px 6px; border-radius: 3px; font-size: 11px;">DISABLED</span>'
-            )
+        return ENABLED_BADGE_HTML if obj.is_enabled else DISABLED_BADGE_HTML
     status_badge.short_description = 'Status'
     
     def mode_badge(self, obj):
         """Display mock/live mode badge."""
-        if obj.is_mock_mode:
-            return format_html(
-                '<span style="background-color: #17a2b8; color: white; padding: 2px 6px; border-radius: 3px; font-size: 11px;">MOCK</span>'
-            )
-        else:
-            return format_html(
-                '<span style="background-color: #28a745; color: white; padding: 2px 6px; border-radius: 3px; font-size: 11px;">LIVE</span>'
-            )
+        return MOCK_BADGE_HTML if obj.is_mock_mode else LIVE_BADGE_HTML
     mode_badge.short_description = 'Mode'
 
 
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class IntegrationsConfig(AppConfig):
@@ -12,4 +13,10 @@ class IntegrationsConfig(AppConfig):
             import integrations.signals
         except Exception:
             # Skip during initialization
-            pass
\ No newline at end of file
+            return
+        
+        # Seed default settings once per migrate rather than on every process start
+        post_migrate.connect(
+            integrations.signals.create_default_integration_settings,
+            sender=self
+        )
\ No newline at end of file
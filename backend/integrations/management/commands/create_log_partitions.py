@@ -0,0 +1,28 @@
+"""
+Django management command to pre-create monthly integration log partitions.
+"""
+
+from django.core.management.base import BaseCommand
+from integrations.partitions import ensure_partitions, is_partitioned
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming monthly partitions for the integration log table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='How many months past the current one to create'
+        )
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            self.stdout.write(self.style.WARNING('Integration log table is not partitioned; nothing to do.'))
+            return
+
+        ensure_partitions(months_ahead=options['months_ahead'])
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Log partitions ready through {options['months_ahead']} months ahead")
+        )
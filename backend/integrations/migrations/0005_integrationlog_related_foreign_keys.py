@@ -0,0 +1,56 @@
+# Generated manually to turn the loose related-object IDs into foreign keys
+# (without database constraints, so logs keep the IDs of deleted rows)
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+        ('organizations', '0001_initial'),
+        ('tasks', '0001_initial'),
+        ('integrations', '0004_remove_integrationsettings_is_mock_mode'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='integrationlog',
+            name='integration_task_id_432ae1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='integrationlog',
+            name='integration_project_feb9cb_idx',
+        ),
+        migrations.RenameField(
+            model_name='integrationlog',
+            old_name='task_id',
+            new_name='task',
+        ),
+        migrations.RenameField(
+            model_name='integrationlog',
+            old_name='project_id',
+            new_name='project',
+        ),
+        migrations.RenameField(
+            model_name='integrationlog',
+            old_name='organization_id',
+            new_name='organization',
+        ),
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='task',
+            field=models.ForeignKey(blank=True, db_column='task_id', null=True, db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='integration_logs', to='tasks.task'),
+        ),
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='project',
+            field=models.ForeignKey(blank=True, db_column='project_id', null=True, db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='integration_logs', to='projects.project'),
+        ),
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='organization',
+            field=models.ForeignKey(blank=True, db_column='organization_id', null=True, db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='integration_logs', to='organizations.organization'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-15 08:35
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('integrations', '0005_integrationlog_related_foreign_keys'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='integrationlog',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('recipient'), name='gin_trgm_ops'), name='ilog_recipient_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='integrationlog',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('subject'), name='gin_trgm_ops'), name='ilog_subject_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='integrationlog',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('error_message'), name='gin_trgm_ops'), name='ilog_error_message_trgm'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-15 08:41
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('integrations', '0006_integrationlog_trigram_search_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='integrationlog',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created_at'], name='ilog_created_brin', pages_per_range=32),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-15 08:39
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0007_integrationlog_created_at_brin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='request_data',
+            field=models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Data sent to external service'),
+        ),
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='response_data',
+            field=models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Response from external service'),
+        ),
+    ]
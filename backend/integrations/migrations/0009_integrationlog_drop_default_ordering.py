@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 08:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0008_integrationlog_json_encoder'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='integrationlog',
+            options={'verbose_name': 'Integration Log', 'verbose_name_plural': 'Integration Logs'},
+        ),
+    ]
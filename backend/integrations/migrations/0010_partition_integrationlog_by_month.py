@@ -0,0 +1,99 @@
+# Generated manually to turn the integration log into a table partitioned by created_at month
+
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.db import migrations
+
+# Frozen copies of the integrations.partitions helpers at the time of this migration
+LOG_TABLE = 'integrations_integrationlog'
+DEFAULT_PARTITION = f'{LOG_TABLE}_default'
+
+OLD_TABLE = f'{LOG_TABLE}_unpartitioned'
+MONTHS_AHEAD = 3
+
+
+def month_start(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def create_month_partition(cursor, month: date) -> None:
+    """Create one month's partition (the DEFAULT partition is still empty here)."""
+    lower, upper = (
+        datetime(m.year, m.month, 1, tzinfo=dt_timezone.utc).isoformat() for m in (month, add_months(month, 1))
+    )
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{LOG_TABLE}_{month:%Y%m}" PARTITION OF "{LOG_TABLE}" '
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+
+
+def partition_integration_log(apps, schema_editor):
+    """
+    Rebuild the log table as PARTITION BY RANGE (created_at).
+
+    PostgreSQL requires the partition key in the primary key, so the new key is
+    (id, created_at); ids still come from the identity sequence and stay unique.
+    Indexes (and any foreign keys) are read from the old table before the rename,
+    so their definitions already name the parent, and recreated there, which
+    cascades them to every partition.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname NOT IN "
+            "(SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s))",
+            [LOG_TABLE, LOG_TABLE]
+        )
+        index_defs = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [LOG_TABLE]
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f'SELECT MIN(created_at) FROM "{LOG_TABLE}"')
+        oldest = cursor.fetchone()[0]
+
+        cursor.execute(f'ALTER TABLE "{LOG_TABLE}" RENAME TO "{OLD_TABLE}"')
+        cursor.execute(
+            f'CREATE TABLE "{LOG_TABLE}" (LIKE "{OLD_TABLE}" INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        cursor.execute(f'CREATE TABLE "{DEFAULT_PARTITION}" PARTITION OF "{LOG_TABLE}" DEFAULT')
+
+        now = datetime.now(dt_timezone.utc)
+        month = month_start(oldest or now)
+        while month <= add_months(month_start(now), MONTHS_AHEAD):
+            create_month_partition(cursor, month)
+            month = add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO "{LOG_TABLE}" OVERRIDING SYSTEM VALUE SELECT * FROM "{OLD_TABLE}"')
+        cursor.execute(f'DROP TABLE "{OLD_TABLE}"')
+        cursor.execute(f'ALTER TABLE "{LOG_TABLE}" ADD PRIMARY KEY (id, created_at)')
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('\"{LOG_TABLE}\"', 'id'), "
+            f'COALESCE(MAX(id), 0) + 1, false) FROM "{LOG_TABLE}"'
+        )
+        for index_def in index_defs:
+            cursor.execute(index_def)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE "{LOG_TABLE}" ADD CONSTRAINT "{name}" {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0009_integrationlog_drop_default_ordering'),
+    ]
+
+    operations = [
+        # Not reversed: the partitioned table serves the same model unchanged
+        migrations.RunPython(partition_integration_log, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,139 @@
+# Generated manually to store IntegrationLog choice columns as small integers
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+# Frozen copies of the IntegrationLog choice codes at the time of this migration
+CODES = {
+    'service': {
+        'mock_email': 0, 'mock_slack': 1, 'email': 2, 'slack': 3, 'integration_orchestrator': 4,
+    },
+    'event_type': {
+        'task_assigned': 0, 'task_status_changed': 1, 'task_completed': 2, 'comment_added': 3,
+        'overdue_reminder': 4, 'daily_digest': 5, 'project_update': 6, 'task_updated': 7,
+    },
+    'status': {
+        'success': 0, 'failed': 1, 'pending': 2, 'retrying': 3,
+    },
+}
+
+
+def encode_choices(apps, schema_editor):
+    """
+    Copy each text value into its integer column.
+
+    Refuses to run while any row holds a value outside CODES: mapping it to a
+    real code would turn a corrupt or legacy row into a plausible success.
+    """
+    IntegrationLog = apps.get_model('integrations', 'IntegrationLog')
+    unknown = {
+        field: count
+        for field, codes in CODES.items()
+        if (count := IntegrationLog.objects.exclude(**{f'{field}__in': list(codes)}).count())
+    }
+    if unknown:
+        raise ValueError(
+            "Integration log rows with unknown choice values; fix or delete them before migrating: "
+            + ", ".join(f"{count} with an unknown {field}" for field, count in unknown.items())
+        )
+    IntegrationLog.objects.update(**{
+        f'{field}_code': Case(
+            *[When(**{field: text}, then=Value(code)) for text, code in codes.items()]
+        )
+        for field, codes in CODES.items()
+    })
+
+
+def decode_choices(apps, schema_editor):
+    IntegrationLog = apps.get_model('integrations', 'IntegrationLog')
+    IntegrationLog.objects.update(**{
+        field: Case(
+            *[When(**{f'{field}_code': code}, then=Value(text)) for text, code in codes.items()],
+            default=Value('')
+        )
+        for field, codes in CODES.items()
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0010_partition_integrationlog_by_month'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='integrationlog',
+            name='integration_service_38db09_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='integrationlog',
+            name='integration_status_9ad1f1_idx',
+        ),
+        migrations.AddField(
+            model_name='integrationlog',
+            name='service_code',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='integrationlog',
+            name='event_type_code',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='integrationlog',
+            name='status_code',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(encode_choices, decode_choices),
+        migrations.RemoveField(
+            model_name='integrationlog',
+            name='service',
+        ),
+        migrations.RemoveField(
+            model_name='integrationlog',
+            name='event_type',
+        ),
+        migrations.RemoveField(
+            model_name='integrationlog',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='integrationlog',
+            old_name='service_code',
+            new_name='service',
+        ),
+        migrations.RenameField(
+            model_name='integrationlog',
+            old_name='event_type_code',
+            new_name='event_type',
+        ),
+        migrations.RenameField(
+            model_name='integrationlog',
+            old_name='status_code',
+            new_name='status',
+        ),
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='service',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Mock Email Service'), (1, 'Mock Slack Service'), (2, 'Email Service'), (3, 'Slack Service'), (4, 'Integration Orchestrator')]),
+        ),
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='event_type',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Task Assigned'), (1, 'Task Status Changed'), (2, 'Task Completed'), (3, 'Comment Added'), (4, 'Overdue Reminder'), (5, 'Daily Digest'), (6, 'Project Update'), (7, 'Task Updated')]),
+        ),
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='status',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Success'), (1, 'Failed'), (2, 'Pending'), (3, 'Retrying')], default=0),
+        ),
+        migrations.AddIndex(
+            model_name='integrationlog',
+            index=models.Index(fields=['service', 'event_type'], name='integration_service_38db09_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='integrationlog',
+            index=models.Index(fields=['status', 'created_at'], name='integration_status_9ad1f1_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-15 08:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+        ('integrations', '0011_integrationlog_small_integer_choices'),
+    ]
+
+    # Plain CREATE INDEX: since 0010 the table is partitioned on PostgreSQL, and
+    # CONCURRENTLY isn't supported on a partitioned parent
+    operations = [
+        migrations.AddIndex(
+            model_name='integrationlog',
+            index=models.Index(fields=['task', '-created_at'], name='ilog_task_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='integrationlog',
+            index=models.Index(fields=['service', 'status'], name='ilog_service_status_idx'),
+        ),
+        # Only drop the single-column task_id index once the composite one exists
+        migrations.AlterField(
+            model_name='integrationlog',
+            name='task',
+            field=models.ForeignKey(blank=True, db_column='task_id', db_index=False, null=True, db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='integration_logs', to='tasks.task'),
+        ),
+    ]
@@ -2,84 +2,136 @@
 Integration models for logging and tracking external service interactions.
 """
 
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, OpClass
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 import json
 
 
+# Settings change rarely but are read on every integration event
+SETTINGS_CACHE_TIMEOUT = 300
+
+
 class IntegrationLog(models.Model):
     """
     Logs all external integration attempts for monitoring and debugging.
     """
     
-    SERVICE_CHOICES = [
-        ('mock_email', 'Mock Email Service'),
-        ('mock_slack', 'Mock Slack Service'),
-        ('email', 'Email Service'),
-        ('slack', 'Slack Service'),
-    ]
-    
-    STATUS_CHOICES = [
-        ('success', 'Success'),
-        ('failed', 'Failed'),
-        ('pending', 'Pending'),
-        ('retrying', 'Retrying'),
-    ]
-    
-    EVENT_TYPE_CHOICES = [
-        ('task_assigned', 'Task Assigned'),
-        ('task_status_changed', 'Task Status Changed'),
-        ('task_completed', 'Task Completed'),
-        ('comment_added', 'Comment Added'),
-        ('overdue_reminder', 'Overdue Reminder'),
-        ('daily_digest', 'Daily Digest'),
-        ('project_update', 'Project Update'),
-    ]
+    # Small-integer codes keep these low-cardinality columns (and the indexes
+    # over them) a couple of bytes wide instead of variable-length text
+    class Service(models.IntegerChoices):
+        MOCK_EMAIL = 0, 'Mock Email Service'
+        MOCK_SLACK = 1, 'Mock Slack Service'
+        EMAIL = 2, 'Email Service'
+        SLACK = 3, 'Slack Service'
+        INTEGRATION_ORCHESTRATOR = 4, 'Integration Orchestrator'
+    
+    class Status(models.IntegerChoices):
+        SUCCESS = 0, 'Success'
+        FAILED = 1, 'Failed'
+        PENDING = 2, 'Pending'
+        RETRYING = 3, 'Retrying'
+    
+    class EventType(models.IntegerChoices):
+        TASK_ASSIGNED = 0, 'Task Assigned'
+        TASK_STATUS_CHANGED = 1, 'Task Status Changed'
+        TASK_COMPLETED = 2, 'Task Completed'
+        COMMENT_ADDED = 3, 'Comment Added'
+        OVERDUE_REMINDER = 4, 'Overdue Reminder'
+        DAILY_DIGEST = 5, 'Daily Digest'
+        PROJECT_UPDATE = 6, 'Project Update'
+        TASK_UPDATED = 7, 'Task Updated'
+    
+    SERVICE_CHOICES = Service.choices
+    STATUS_CHOICES = Status.choices
+    EVENT_TYPE_CHOICES = EventType.choices
     
     # Basic fields
-    service = models.CharField(max_length=50, choices=SERVICE_CHOICES)
-    event_type = models.CharField(max_length=50, choices=EVENT_TYPE_CHOICES)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='success')
+    service = models.PositiveSmallIntegerField(choices=Service.choices)
+    event_type = models.PositiveSmallIntegerField(choices=EventType.choices)
+    status = models.PositiveSmallIntegerField(choices=Status.choices, default=Status.SUCCESS)
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
-    # Related objects (optional foreign keys)
-    task_id = models.IntegerField(null=True, blank=True)
-    project_id = models.IntegerField(null=True, blank=True)
-    organization_id = models.IntegerField(null=True, blank=True)
+    # Related objects. No database constraint and DO_NOTHING on delete: a log is
+    # an audit record, so it keeps the IDs of tasks/projects/organizations that
+    # have since been deleted
+    task = models.ForeignKey(
+        'tasks.Task',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        db_index=False,  # covered by the (task, -created_at) index below
+        db_column='task_id',
+        related_name='integration_logs'
+    )
+    project = models.ForeignKey(
+        'projects.Project',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        db_index=True,
+        db_column='project_id',
+        related_name='integration_logs'
+    )
+    organization = models.ForeignKey(
+        'organizations.Organization',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        db_index=True,
+        db_column='organization_id',
+        related_name='integration_logs'
+    )
     
     # Integration details
     recipient = models.EmailField(blank=True)  # Email recipient or Slack channel
     subject = models.CharField(max_length=255, blank=True)  # Email subject or Slack message preview
     
     # JSON fields for flexible data storage
-    request_data = models.JSONField(default=dict, help_text="Data sent to external service")
-    response_data = models.JSONField(default=dict, help_text="Response from external service")
+    request_data = models.JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="Data sent to external service")
+    response_data = models.JSONField(default=dict, encoder=DjangoJSONEncoder, help_text="Response from external service")
     error_message = models.TextField(blank=True, help_text="Error details if integration failed")
     
     # Performance tracking
     response_time_ms = models.IntegerField(null=True, blank=True, help_text="Response time in milliseconds")
     
     class Meta:
-        ordering = ['-created_at']
+        # No default ordering: counts, exists() and purges shouldn't pay for a
+        # sort. Listings order explicitly (the admin sets its own ordering).
         verbose_name = 'Integration Log'
         verbose_name_plural = 'Integration Logs'
         indexes = [
             models.Index(fields=['service', 'event_type']),
             models.Index(fields=['status', 'created_at']),
-            models.Index(fields=['task_id']),
-            models.Index(fields=['project_id']),
+            # A task's log history, newest first (also serves task_id lookups)
+            models.Index(fields=['task', '-created_at'], name='ilog_task_created_idx'),
+            models.Index(fields=['service', 'status'], name='ilog_service_status_idx'),
+            # Rows are appended in created_at order, so a BRIN index answers
+            # date-range scans (e.g. purging old logs) at a fraction of a B-tree's size
+            BrinIndex(fields=['created_at'], pages_per_range=32, name='ilog_created_brin'),
+            # Trigram indexes on UPPER(col) match the admin's icontains search
+            # (UPPER(col::text) LIKE UPPER('%q%')), which a B-tree can't serve
+            GinIndex(OpClass(Upper('recipient'), name='gin_trgm_ops'), name='ilog_recipient_trgm'),
+            GinIndex(OpClass(Upper('subject'), name='gin_trgm_ops'), name='ilog_subject_trgm'),
+            GinIndex(OpClass(Upper('error_message'), name='gin_trgm_ops'), name='ilog_error_message_trgm'),
         ]
     
     def __str__(self):
-        return f"{self.service} - {self.event_type} ({self.status})"
+        return f"{self.get_service_display()} - {self.get_event_type_display()} ({self.get_status_display()})"
     
     @property
     def is_successful(self):
         """Check if integration was successful."""
-        return self.status == 'success'
+        return self.status == self.Status.SUCCESS
     
     @property
     def formatted_response_data(self):
@@ -88,18 +140,25 @@ class IntegrationLog(models.Model):
     
     def mark_as_failed(self, error_message: str):
         """Mark integration as failed with error details."""
-        self.status = 'failed'
+        self.status = self.Status.FAILED
         self.error_message = error_message
         self.updated_at = timezone.now()
-        self.save()
+        # Targeted UPDATE so the JSON payload columns aren't rewritten
+        type(self).objects.filter(pk=self.pk).update(
+            status=self.status,
+            error_message=self.error_message,
+            updated_at=self.updated_at
+        )
     
     def mark_as_success(self, response_data: dict = None):
         """Mark integration as successful with response data."""
-        self.status = 'success'
+        self.status = self.Status.SUCCESS
+        self.updated_at = timezone.now()
+        changes = {'status': self.status, 'updated_at': self.updated_at}
         if response_data:
             self.response_data = response_data
-        self.updated_at = timezone.now()
-        self.save()
+            changes['response_data'] = response_data
+        type(self).objects.filter(pk=self.pk).update(**changes)
 
 
 class IntegrationSettings(models.Model):
@@ -129,20 +188,31 @@ class IntegrationSettings(models.Model):
     def __str__(self):
         return f"{self.service_name} ({'Enabled' if self.is_enabled else 'Disabled'})"
     
+    @staticmethod
+    def cache_key(service_name: str) -> str:
+        """Cache key holding the flags for a service."""
+        return f'integrations:settings:{service_name}'
+    
+    @classmethod
+    def _cached_flags(cls, service_name: str) -> dict:
+        """Load a service's flags through the cache (empty dict if not configured)."""
+        def load():
+            setting = cls.objects.filter(service_name=service_name).first()
+            if setting is None:
+                return {}
+            return {
+                'is_enabled': setting.is_enabled,
+                'is_mock_mode': bool(setting.is_mock_mode),
+            }
+        
+        return cache.get_or_set(cls.cache_key(service_name), load, timeout=SETTINGS_CACHE_TIMEOUT)
+    
     @classmethod
     def is_service_enabled(cls, service_name: str) -> bool:
         """Check if a specific service is enabled."""
-        try:
-            setting = cls.objects.get(service_name=service_name)
-            return setting.is_enabled
-        except cls.DoesNotExist:
-            return False
+        return cls._cached_flags(service_name).get('is_enabled', False)
     
     @classmethod
     def is_mock_mode(cls, service_name: str) -> bool:
         """Check if service should use mock mode."""
-        try:
-            setting = cls.objects.get(service_name=service_name)
-            return setting.is_mock_mode
-        except cls.DoesNotExist:
-            return True  # Default to mock mode
\ No newline at end of file
+        return cls._cached_flags(service_name).get('is_mock_mode', True)  # Default to mock mode
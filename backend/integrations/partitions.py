@@ -0,0 +1,126 @@
+"""
+Monthly range partitions for the integration log table (PostgreSQL only).
+
+The log table is partitioned by created_at month, so purging old logs drops
+whole partitions instead of deleting row by row. A DEFAULT partition catches
+rows outside the pre-created months; run the ``create_log_partitions``
+management command periodically (e.g. daily from cron) to keep months ahead.
+"""
+
+import re
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.db import connections, transaction
+
+LOG_TABLE = 'integrations_integrationlog'
+DEFAULT_PARTITION = f'{LOG_TABLE}_default'
+PARTITION_NAME_RE = re.compile(rf'^{LOG_TABLE}_(\d{{4}})(\d{{2}})$')
+
+
+def month_start(value) -> date:
+    """First day of the month containing ``value``."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Shift a month-start date by ``count`` months."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f'{LOG_TABLE}_{month:%Y%m}'
+
+
+def _bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc).isoformat()
+
+
+def is_partitioned(using: str = 'default') -> bool:
+    """Whether the log table is a partitioned table on this connection."""
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))",
+            [LOG_TABLE]
+        )
+        return cursor.fetchone()[0]
+
+
+def create_month_partition(cursor, month: date) -> None:
+    """
+    Create the partition for one month if it doesn't exist yet.
+
+    PostgreSQL refuses to add a partition while the DEFAULT partition holds rows
+    in its range, so any such rows are moved: the default is detached, the month
+    created, its rows re-inserted through the parent, and the default re-attached.
+    """
+    name = partition_name(month)
+    cursor.execute("SELECT to_regclass(%s) IS NOT NULL, to_regclass(%s) IS NOT NULL", [name, DEFAULT_PARTITION])
+    exists, has_default = cursor.fetchone()
+    if exists:
+        return
+
+    lower, upper = _bound(month), _bound(add_months(month, 1))
+    in_range = f"created_at >= '{lower}' AND created_at < '{upper}'"
+    rows_in_default = False
+    if has_default:
+        cursor.execute(f'SELECT EXISTS (SELECT 1 FROM "{DEFAULT_PARTITION}" WHERE {in_range})')
+        rows_in_default = cursor.fetchone()[0]
+
+    with transaction.atomic(using=cursor.db.alias):
+        if rows_in_default:
+            cursor.execute(f'ALTER TABLE "{LOG_TABLE}" DETACH PARTITION "{DEFAULT_PARTITION}"')
+        cursor.execute(
+            f'CREATE TABLE "{name}" PARTITION OF "{LOG_TABLE}" '
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        )
+        if rows_in_default:
+            cursor.execute(
+                f'INSERT INTO "{LOG_TABLE}" OVERRIDING SYSTEM VALUE '
+                f'SELECT * FROM "{DEFAULT_PARTITION}" WHERE {in_range}'
+            )
+            cursor.execute(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE {in_range}')
+            cursor.execute(f'ALTER TABLE "{LOG_TABLE}" ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT')
+
+
+def ensure_partitions(months_ahead: int = 3, start=None, using: str = 'default') -> None:
+    """Create monthly partitions from ``start`` (default: this month) through ``months_ahead``."""
+    if not is_partitioned(using):
+        return
+    first = month_start(start or datetime.now(dt_timezone.utc))
+    last = add_months(month_start(datetime.now(dt_timezone.utc)), months_ahead)
+    with connections[using].cursor() as cursor:
+        month = first
+        while month <= last:
+            create_month_partition(cursor, month)
+            month = add_months(month, 1)
+
+
+def drop_partitions_before(cutoff, using: str = 'default') -> int:
+    """
+    Detach and drop every monthly partition that ends on or before ``cutoff``.
+
+    Returns the number of partitions dropped. Rows in the month containing the
+    cutoff (and in the DEFAULT partition) are left for a regular DELETE.
+    """
+    if not is_partitioned(using):
+        return 0
+    boundary = month_start(cutoff)
+    dropped = 0
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(%s)",
+            [LOG_TABLE]
+        )
+        for (name,) in cursor.fetchall():
+            match = PARTITION_NAME_RE.match(name)
+            if not match or date(int(match[1]), int(match[2]), 1) >= boundary:
+                continue
+            cursor.execute(f'ALTER TABLE "{LOG_TABLE}" DETACH PARTITION "{name}"')
+            cursor.execute(f'DROP TABLE "{name}"')
+            dropped += 1
+    return dropped
@@ -7,155 +7,178 @@ for demonstration purposes. In production, these would be replaced with real API
 
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, FrozenSet, List, Optional
+
+from django.core.cache import cache
+from organizations.models import Organization
+from .models import SETTINGS_CACHE_TIMEOUT, IntegrationLog, IntegrationSettings
 
 logger = logging.getLogger(__name__)
 
 
+def organization_slug_cache_key(organization_id: int) -> str:
+    """Cache key holding an organization's slug."""
+    return f'integrations:organization-slug:{organization_id}'
+
+
+def organization_slug(organization_id: int) -> str:
+    """
+    Slug (Slack channel name) of an organization, through the Django cache.
+    
+    The Organization save/delete signals delete the key; the timeout (as for
+    the IntegrationSettings flags) bounds how long a process whose cache the
+    signal didn't reach keeps posting to the old channel.
+    """
+    return cache.get_or_set(
+        organization_slug_cache_key(organization_id),
+        lambda: Organization.objects.values_list('slug', flat=True).get(pk=organization_id),
+        timeout=SETTINGS_CACHE_TIMEOUT
+    )
+
+
 class MockEmailService:
     """Mock email service for demonstrating email integrations."""
     
     @staticmethod
-    def send_task_assignment_email(task, assignee_email: str) -> Dict[str, Any]:
+    def send_task_assignment_email(task, assignee_email: str, *, event_ts: Optional[str] = None) -> Dict[str, Any]:
         """Send email when task is assigned to someone."""
-        message = f"📧 [MOCK EMAIL] Task '{task.title}' assigned to {assignee_email}"
-        print(message)
-        logger.info(f"Mock email sent: Task assignment - {task.title} to {assignee_email}")
+        logger.info("📧 [MOCK EMAIL] Task '%s' assigned to %s", task.title, assignee_email)
         
         return {
             "status": "sent",
             "to": assignee_email,
             "subject": f"Task Assigned: {task.title}",
             "service": "mock_email",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": event_ts or datetime.now().isoformat(),
             "task_id": task.id,
             "project": task.project.name
         }
     
     @staticmethod
-    def send_status_change_email(task, old_status: str, new_status: str) -> Dict[str, Any]:
+    def send_status_change_email(task, old_status: str, new_status: str, *,
+                                 event_ts: Optional[str] = None) -> Dict[str, Any]:
         """Send email when task status changes."""
-        message = f"📧 [MOCK EMAIL] Task '{task.title}' changed from {old_status} to {new_status}"
-        print(message)
-        logger.info(f"Mock email sent: Status change - {task.title} ({old_status} → {new_status})")
+        logger.info("📧 [MOCK EMAIL] Task '%s' changed from %s to %s", task.title, old_status, new_status)
         
         return {
             "status": "sent",
             "to": task.assignee_email or "project-team@example.com",
             "subject": f"Task Update: {task.title}",
             "service": "mock_email",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": event_ts or datetime.now().isoformat(),
             "task_id": task.id,
             "old_status": old_status,
             "new_status": new_status
         }
     
     @staticmethod
-    def send_comment_notification_email(task_comment) -> Dict[str, Any]:
+    def send_comment_notification_email(task_comment, *, event_ts: Optional[str] = None) -> Dict[str, Any]:
         """Send email when new comment is added."""
         task = task_comment.task
-        message = f"📧 [MOCK EMAIL] New comment on task '{task.title}' by {task_comment.author_email}"
-        print(message)
-        logger.info(f"Mock email sent: New comment - {task.title} by {task_comment.author_email}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📧 [MOCK EMAIL] New comment on task '%s' by %s", task.title, task_comment.author_email)
         
         return {
             "status": "sent",
             "to": task.assignee_email or "project-team@example.com",
             "subject": f"New Comment: {task.title}",
             "service": "mock_email",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": event_ts or datetime.now().isoformat(),
             "task_id": task.id,
             "comment_author": task_comment.author_email
         }
     
     @staticmethod
-    def send_overdue_reminder(task) -> Dict[str, Any]:
+    def send_overdue_reminder(task, *, event_ts: Optional[str] = None) -> Dict[str, Any]:
         """Send overdue task reminder email."""
-        message = f"📧 [MOCK EMAIL] OVERDUE: Task '{task.title}' is past due date"
-        print(message)
-        logger.warning(f"Mock email sent: Overdue reminder - {task.title}")
+        logger.warning("📧 [MOCK EMAIL] OVERDUE: Task '%s' is past due date", task.title)
         
         return {
             "status": "sent",
             "to": task.assignee_email or "project-manager@example.com",
             "subject": f"OVERDUE: {task.title}",
             "service": "mock_email",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": event_ts or datetime.now().isoformat(),
             "task_id": task.id,
             "due_date": task.due_date.isoformat() if task.due_date else None
         }
 
 
 class MockSlackService:
-    """Mock Slack service for demonstrating team communication integrations."""
+    """
+    Mock Slack service for demonstrating team communication integrations.
+    
+    Messages go to the organization's channel. Callers that already hold the
+    organization slug (e.g. from a select_related queryset) can pass it as
+    ``channel`` to skip walking task -> project -> organization.
+    """
     
     @staticmethod
-    def post_task_assignment(task, assignee_email: str) -> Dict[str, Any]:
+    def post_task_assignment(task, assignee_email: str, *, channel: Optional[str] = None,
+                             event_ts: Optional[str] = None) -> Dict[str, Any]:
         """Post Slack message when task is assigned."""
-        channel = task.project.organization.slug
-        message = f"💬 [MOCK SLACK] #{channel}: Task '{task.title}' assigned to {assignee_email}"
-        print(message)
-        logger.info(f"Mock Slack message: Task assignment - {task.title} to {assignee_email}")
+        channel = channel or task.project.organization.slug
+        logger.info("💬 [MOCK SLACK] #%s: Task '%s' assigned to %s", channel, task.title, assignee_email)
         
         return {
             "status": "posted",
             "channel": f"#{channel}",
             "message": f"📋 Task assigned: *{task.title}* → {assignee_email}",
             "service": "mock_slack",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": event_ts or datetime.now().isoformat(),
             "task_id": task.id
         }
     
     @staticmethod
-    def post_task_completion(task) -> Dict[str, Any]:
+    def post_task_completion(task, *, channel: Optional[str] = None,
+                             event_ts: Optional[str] = None) -> Dict[str, Any]:
         """Post Slack message when task is completed."""
-        channel = task.project.organization.slug
+        channel = channel or task.project.organization.slug
         assignee = task.assignee_email or "team member"
-        message = f"💬 [MOCK SLACK] #{channel}: Task '{task.title}' completed by {assignee} ✅"
-        print(message)
-        logger.info(f"Mock Slack message: Task completion - {task.title} by {assignee}")
+        logger.info("💬 [MOCK SLACK] #%s: Task '%s' completed by %s ✅", channel, task.title, assignee)
         
         return {
             "status": "posted",
             "channel": f"#{channel}",
             "message": f"✅ Task completed: *{task.title}* by {assignee}",
             "service": "mock_slack",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": event_ts or datetime.now().isoformat(),
             "task_id": task.id,
             "assignee": assignee
         }
     
     @staticmethod
-    def post_project_update(project, message: str) -> Dict[str, Any]:
+    def post_project_update(project, message: str, *, channel: Optional[str] = None,
+                            event_ts: Optional[str] = None) -> Dict[str, Any]:
         """Post general project update to Slack."""
-        channel = project.organization.slug
-        slack_message = f"💬 [MOCK SLACK] #{channel}: {message}"
-        print(slack_message)
-        logger.info(f"Mock Slack message: Project update - {project.name}")
+        channel = channel or project.organization.slug
+        logger.info("💬 [MOCK SLACK] #%s: %s", channel, message)
         
         return {
             "status": "posted",
             "channel": f"#{channel}",
             "message": f"📊 Project update: {message}",
             "service": "mock_slack",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": event_ts or datetime.now().isoformat(),
             "project_id": project.id
         }
     
     @staticmethod
-    def post_daily_digest(organization, task_count: int, completed_count: int) -> Dict[str, Any]:
+    def post_daily_digest(organization, task_count: int, completed_count: int, *,
+                          event_ts: Optional[str] = None) -> Dict[str, Any]:
         """Post daily project digest to Slack."""
         channel = organization.slug
-        message = f"💬 [MOCK SLACK] #{channel}: Daily digest - {completed_count}/{task_count} tasks completed today"
-        print(message)
-        logger.info(f"Mock Slack message: Daily digest - {organization.name}")
+        logger.info(
+            "💬 [MOCK SLACK] #%s: Daily digest - %s/%s tasks completed today",
+            channel, completed_count, task_count
+        )
         
         return {
             "status": "posted",
             "channel": f"#{channel}",
             "message": f"📊 Daily digest: {completed_count}/{task_count} tasks completed today",
             "service": "mock_slack",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": event_ts or datetime.now().isoformat(),
             "organization_id": organization.id
         }
 
@@ -163,35 +186,178 @@ class MockSlackService:
 class IntegrationOrchestrator:
     """Orchestrates multiple integration services."""
     
+    EMAIL_SERVICE = 'mock_email'
+    SLACK_SERVICE = 'mock_slack'
+    
+    # IntegrationSettings names -> IntegrationLog service codes
+    LOG_SERVICES = {
+        EMAIL_SERVICE: IntegrationLog.Service.MOCK_EMAIL,
+        SLACK_SERVICE: IntegrationLog.Service.MOCK_SLACK,
+    }
+    
     def __init__(self):
         self.email_service = MockEmailService()
         self.slack_service = MockSlackService()
     
-    def handle_task_assigned(self, task, assignee_email: str) -> Dict[str, Any]:
-        """Handle task assignment with multiple integrations."""
-        results = {
-            "email": self.email_service.send_task_assignment_email(task, assignee_email),
-            "slack": self.slack_service.post_task_assignment(task, assignee_email)
-        }
+    def _enabled_services(self) -> FrozenSet[str]:
+        """Services switched on in IntegrationSettings (cached, so no query once warm)."""
+        return frozenset(
+            name for name in (self.EMAIL_SERVICE, self.SLACK_SERVICE)
+            if IntegrationSettings.is_service_enabled(name)
+        )
+    
+    @staticmethod
+    def _skipped(service: str) -> Dict[str, Any]:
+        """Result placeholder for a disabled service, so callers see the same keys."""
+        return {"status": "skipped", "service": service}
+    
+    @staticmethod
+    def _organization_ref(task, organization_id: Optional[int], channel: Optional[str]):
+        """Organization id and slug for a task, resolving only what wasn't passed in."""
+        if organization_id is None:
+            organization_id = task.project.organization_id
+        if channel is None:
+            project = task.project
+            if type(project).organization.is_cached(project):
+                channel = project.organization.slug
+            else:
+                channel = organization_slug(organization_id)
+        return organization_id, channel
+    
+    @classmethod
+    def _build_log(cls, task, service: str, event_type: int, recipient: str,
+                   subject: str, response_data: Dict[str, Any],
+                   organization_id: Optional[int] = None) -> IntegrationLog:
+        """Build an unsaved log row for one service call."""
+        if organization_id is None:
+            organization_id = task.project.organization_id
+        return IntegrationLog(
+            service=cls.LOG_SERVICES[service],
+            event_type=event_type,
+            status=IntegrationLog.Status.SUCCESS,
+            task_id=task.id,
+            project_id=task.project_id,
+            organization_id=organization_id,
+            recipient=recipient,
+            subject=subject,
+            response_data=response_data,
+            response_time_ms=0
+        )
+    
+    @staticmethod
+    def _flush_logs(logs: List[IntegrationLog], log_buffer: Optional[List[IntegrationLog]] = None) -> None:
+        """Write all log rows for one event in a single INSERT, or defer them to the caller's buffer."""
+        if log_buffer is not None:
+            log_buffer.extend(logs)
+            return
+        IntegrationLog.objects.bulk_create(logs, batch_size=500)
+    
+    def _notify_services(self, task, event_type: int, send_email: Callable[[], Dict[str, Any]],
+                         post_slack: Callable[[], Dict[str, Any]], slack_subject: str,
+                         organization_id: int, log_buffer: Optional[List[IntegrationLog]],
+                         log_email: bool = True) -> Dict[str, Any]:
+        """
+        Call each enabled service for one task event and log the calls (one INSERT).
+        
+        ``log_email=False`` sends the email without logging it, for events whose
+        email is already logged under another event type.
+        """
+        enabled = self._enabled_services()
+        results, logs = {}, []
         
-        print(f"🔗 [INTEGRATION] Task '{task.title}' assignment handled via email & Slack")
+        if self.EMAIL_SERVICE in enabled:
+            results["email"] = send_email()
+            if log_email:
+                logs.append(self._build_log(task, self.EMAIL_SERVICE, event_type, results['email']['to'],
+                                            results['email']['subject'], results['email'], organization_id))
+        else:
+            results["email"] = self._skipped(self.EMAIL_SERVICE)
+        
+        if self.SLACK_SERVICE in enabled:
+            results["slack"] = post_slack()
+            logs.append(self._build_log(task, self.SLACK_SERVICE, event_type, results['slack']['channel'],
+                                        slack_subject, results['slack'], organization_id))
+        else:
+            results["slack"] = self._skipped(self.SLACK_SERVICE)
+        
+        self._flush_logs(logs, log_buffer)
         return results
     
-    def handle_task_completed(self, task) -> Dict[str, Any]:
-        """Handle task completion with multiple integrations."""
-        results = {
-            "email": self.email_service.send_status_change_email(task, "IN_PROGRESS", "DONE"),
-            "slack": self.slack_service.post_task_completion(task)
-        }
+    def handle_task_assigned(self, task, assignee_email: str, *, organization_id: Optional[int] = None,
+                             channel: Optional[str] = None,
+                             log_buffer: Optional[List[IntegrationLog]] = None) -> Dict[str, Any]:
+        """
+        Handle task assignment with multiple integrations.
+        
+        ``organization_id``/``channel`` may be passed when the caller already
+        resolved the task's organization, saving the project/organization lookups.
+        With ``log_buffer`` the log rows are appended there for the caller to
+        write together with its own, instead of being inserted here.
+        """
+        organization_id, channel = self._organization_ref(task, organization_id, channel)
+        event_ts = datetime.now().isoformat()  # One timestamp shared by every service call
         
-        print(f"🔗 [INTEGRATION] Task '{task.title}' completion handled via email & Slack")
+        results = self._notify_services(
+            task, IntegrationLog.EventType.TASK_ASSIGNED,
+            lambda: self.email_service.send_task_assignment_email(task, assignee_email, event_ts=event_ts),
+            lambda: self.slack_service.post_task_assignment(task, assignee_email, channel=channel, event_ts=event_ts),
+            f"Task assigned: {task.title}", organization_id, log_buffer
+        )
+        
+        logger.info("🔗 [INTEGRATION] Task '%s' assignment handled via email & Slack", task.title)
         return results
     
+    def handle_task_completed(self, task, *, organization_id: Optional[int] = None,
+                              channel: Optional[str] = None,
+                              log_buffer: Optional[List[IntegrationLog]] = None) -> Dict[str, Any]:
+        """Handle task completion with multiple integrations (see handle_task_assigned)."""
+        organization_id, channel = self._organization_ref(task, organization_id, channel)
+        event_ts = datetime.now().isoformat()
+        
+        results = self._notify_services(
+            task, IntegrationLog.EventType.TASK_COMPLETED,
+            lambda: self.email_service.send_status_change_email(task, "IN_PROGRESS", "DONE", event_ts=event_ts),
+            lambda: self.slack_service.post_task_completion(task, channel=channel, event_ts=event_ts),
+            f"Task completed: {task.title}", organization_id, log_buffer,
+            # The status-change email is logged as TASK_STATUS_CHANGED; only Slack logs the completion
+            log_email=False
+        )
+        
+        logger.info("🔗 [INTEGRATION] Task '%s' completion handled via email & Slack", task.title)
+        return results
+
+    def handle_task_status_changed(self, task, old_status: str, new_status: str, *,
+                                   organization_id: Optional[int] = None,
+                                   log_buffer: Optional[List[IntegrationLog]] = None) -> Dict[str, Any]:
+        """Handle a task status change with email notification (see handle_task_assigned)."""
+        if self.EMAIL_SERVICE not in self._enabled_services():
+            return {"email": self._skipped(self.EMAIL_SERVICE)}
+
+        results = {
+            "email": self.email_service.send_status_change_email(task, old_status, new_status)
+        }
+
+        self._flush_logs([
+            self._build_log(task, self.EMAIL_SERVICE, IntegrationLog.EventType.TASK_STATUS_CHANGED,
+                            results['email']['to'], results['email']['subject'], results['email'],
+                            organization_id),
+        ], log_buffer)
+        return results
+
     def handle_new_comment(self, task_comment) -> Dict[str, Any]:
         """Handle new comment with email notification."""
+        if self.EMAIL_SERVICE not in self._enabled_services():
+            return {"email": self._skipped(self.EMAIL_SERVICE)}
+        
         results = {
             "email": self.email_service.send_comment_notification_email(task_comment)
         }
         
-        print(f"🔗 [INTEGRATION] New comment on '{task_comment.task.title}' handled via email")
-        return results
\ No newline at end of file
+        self._flush_logs([
+            self._build_log(task_comment.task, self.EMAIL_SERVICE, IntegrationLog.EventType.COMMENT_ADDED,
+                            results['email']['to'], results['email']['subject'], results['email']),
+        ])
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🔗 [INTEGRATION] New comment on '%s' handled via email", task_comment.task.title)
+        return results
@@ -6,64 +6,152 @@ providing automatic notifications and updates to external systems.
 """
 
 import logging
-from datetime import datetime
-from django.db.models.signals import post_save, pre_save
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import List, NamedTuple, Optional, Tuple
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from organizations.models import Organization
 from tasks.models import Task, TaskComment
-from .services import IntegrationOrchestrator, MockEmailService, MockSlackService
 from .models import IntegrationLog, IntegrationSettings
 
+# The services module is imported inside the functions that use it, so
+# loading the signals at startup (migrate, short management commands) doesn't
+# pull in the service graph until an integration actually fires.
+
 logger = logging.getLogger(__name__)
 
+# Marks "pre_save didn't record a previous value" (None is a valid old value)
+_MISSING = object()
+
+# Task fields whose changes trigger integrations
+TRACKED_TASK_FIELDS = frozenset({'status', 'assignee_email'})
 
-def log_integration(service: str, event_type: str, **kwargs):
-    """Helper function to log integration attempts."""
-    try:
-        # Only log if the model is available
-        from django.apps import apps
-        if apps.is_installed('integrations'):
-            IntegrationLog.objects.create(
-                service=service,
-                event_type=event_type,
-                status='success',
-                task_id=kwargs.get('task_id'),
-                project_id=kwargs.get('project_id'),
-                organization_id=kwargs.get('organization_id'),
-                recipient=kwargs.get('recipient', ''),
-                subject=kwargs.get('subject', ''),
-                response_data=kwargs.get('response_data', {}),
-                request_data=kwargs.get('request_data', {}),
-                response_time_ms=kwargs.get('response_time_ms', 0)
-            )
-    except Exception as e:
-        # Silently skip logging errors during startup
-        pass
+
+def _touches_tracked_fields(update_fields) -> bool:
+    """False when a save(update_fields=...) can't have changed status or assignee."""
+    return update_fields is None or not TRACKED_TASK_FIELDS.isdisjoint(update_fields)
+
+
+@lru_cache(maxsize=None)
+def _get_orchestrator():
+    """The shared orchestrator (stateless, so one instance serves every event), built on first use."""
+    from .services import IntegrationOrchestrator
+    return IntegrationOrchestrator()
 
 
 @receiver(pre_save, sender=Task)
 def track_task_changes(sender, instance, **kwargs):
     """Track task changes to detect status updates and assignments."""
+    instance._cached_project_id = instance._cached_org_id = instance._cached_org_slug = None
+    if not _touches_tracked_fields(kwargs.get('update_fields')):
+        return  # Nothing to compare, so skip the SELECT
+    row = None
     if instance.pk:  # Task is being updated
-        try:
-            old_instance = Task.objects.get(pk=instance.pk)
-            
-            # Store old values for comparison in post_save
-            instance._old_status = old_instance.status
-            instance._old_assignee = old_instance.assignee_email
-            
-        except Task.DoesNotExist:
-            # New task
-            instance._old_status = None
-            instance._old_assignee = None
-    else:
+        # One narrow row (joined through to the organization) instead of a
+        # full Task instance, so post_save can log and notify without walking
+        # task -> project -> organization again
+        row = Task.objects.filter(pk=instance.pk).values_list(
+            'status', 'assignee_email', 'project_id',
+            'project__organization_id', 'project__organization__slug'
+        ).first()
+    
+    if row is None:
         # New task
         instance._old_status = None
         instance._old_assignee = None
+        return
+    
+    # Store old values for comparison in post_save
+    instance._old_status, instance._old_assignee, project_id, org_id, org_slug = row
+    if project_id == instance.project_id:
+        instance._cached_project_id = project_id
+        instance._cached_org_id = org_id
+        instance._cached_org_slug = org_slug
+
+
+class TaskChanges(NamedTuple):
+    """What a task save changed, captured in post_save for the dispatch after commit."""
+    assignee_email: Optional[str]  # new assignee, if the task was (re)assigned
+    status_change: Optional[Tuple[str, str]]  # (old, new) status, if it changed
+    org_id: Optional[int] = None
+    org_slug: Optional[str] = None
+
+
+def _is_new_assignment(changes: TaskChanges) -> bool:
+    return bool(changes.assignee_email)
+
+
+def _is_status_change(changes: TaskChanges) -> bool:
+    return changes.status_change is not None
+
+
+def _is_completion(changes: TaskChanges) -> bool:
+    return changes.status_change is not None and changes.status_change[1] == 'DONE'
+
+
+def _handle_assigned(task, changes: TaskChanges, logs: List[IntegrationLog]):
+    _get_orchestrator().handle_task_assigned(task, changes.assignee_email, organization_id=changes.org_id,
+                                             channel=changes.org_slug, log_buffer=logs)
+
+
+def _handle_status(task, changes: TaskChanges, logs: List[IntegrationLog]):
+    old_status, new_status = changes.status_change
+    _get_orchestrator().handle_task_status_changed(task, old_status, new_status, organization_id=changes.org_id,
+                                                   log_buffer=logs)
+
+
+def _handle_completed(task, changes: TaskChanges, logs: List[IntegrationLog]):
+    _get_orchestrator().handle_task_completed(task, organization_id=changes.org_id, channel=changes.org_slug,
+                                              log_buffer=logs)
+
+
+# (predicate, handler) pairs, run in order for every task save
+EVENT_HANDLERS = (
+    (_is_new_assignment, _handle_assigned),
+    (_is_status_change, _handle_status),
+    (_is_completion, _handle_completed),
+)
+
+
+def dispatch_task_changes(task, changes: TaskChanges):
+    """
+    Run the integrations for one task save.
+    
+    Scheduled by handle_task_changes to run once the save has committed, so
+    no transaction (or row lock) is held across the outbound calls. This is
+    the unit a task queue worker would run.
+    """
+    # Every log row for this save, written with one INSERT at the end
+    logs = []
+    
+    try:
+        for applies, handler in EVENT_HANDLERS:
+            if applies(changes):
+                handler(task, changes, logs)
+        
+        IntegrationLog.objects.bulk_create(logs, batch_size=100)
+    
+    except Exception as e:
+        logger.error("Error handling task changes for task %s: %s", task.id, e)
+        
+        # Log failed integration
+        IntegrationLog.objects.create(
+            service=IntegrationLog.Service.INTEGRATION_ORCHESTRATOR,
+            event_type=IntegrationLog.EventType.TASK_UPDATED,
+            status=IntegrationLog.Status.FAILED,
+            task_id=task.id,
+            project_id=task.project_id,
+            organization_id=changes.org_id,
+            error_message=str(e)
+        )
 
 
 @receiver(post_save, sender=Task)
 def handle_task_changes(sender, instance, created, **kwargs):
-    """Handle task creation, assignment, and status changes."""
+    """Detect task assignment and status changes and schedule their integrations."""
     
     # Skip if integrations app is not ready
     try:
@@ -73,120 +161,58 @@ def handle_task_changes(sender, instance, created, **kwargs):
     except Exception:
         return
     
-    orchestrator = IntegrationOrchestrator()
+    if not _touches_tracked_fields(kwargs.get('update_fields')):
+        return
     
+    if created:
+        # New task created - only an initial assignee triggers anything
+        assignee_email = instance.assignee_email
+        status_change = None
+    else:
+        # Task updated - check for assignment and status changes
+        old_assignee = getattr(instance, '_old_assignee', _MISSING)
+        assignee_changed = old_assignee is not _MISSING and old_assignee != instance.assignee_email
+        assignee_email = instance.assignee_email if assignee_changed else None
+        status_change = None
+        old_status = getattr(instance, '_old_status', _MISSING)
+        if old_status is not _MISSING and old_status != instance.status:
+            status_change = (old_status or 'NEW', instance.status)
+    
+    if not assignee_email and not status_change:
+        return
+    
+    # Values are captured now: the instance may be changed again before commit.
+    # The organization was resolved by track_task_changes; None for new tasks
+    # (or a project change), in which case it's looked up only if needed.
+    changes = TaskChanges(
+        assignee_email, status_change,
+        getattr(instance, '_cached_org_id', None), getattr(instance, '_cached_org_slug', None)
+    )
+    transaction.on_commit(partial(dispatch_task_changes, instance, changes), using=kwargs.get('using'))
+
+
+def dispatch_new_comment(task_comment):
+    """Run the integrations for a new comment (after the comment has committed)."""
     try:
-        if created:
-            # New task created
-            if instance.assignee_email:
-                # Task created with assignee
-                results = orchestrator.handle_task_assigned(instance, instance.assignee_email)
-                
-                # Log email integration
-                if 'email' in results:
-                    log_integration(
-                        service='mock_email',
-                        event_type='task_assigned',
-                        task_id=instance.id,
-                        project_id=instance.project.id,
-                        organization_id=instance.project.organization.id,
-                        recipient=instance.assignee_email,
-                        subject=f"Task Assigned: {instance.title}",
-                        response_data=results['email']
-                    )
-                
-                # Log Slack integration
-                if 'slack' in results:
-                    log_integration(
-                        service='mock_slack',
-                        event_type='task_assigned',
-                        task_id=instance.id,
-                        project_id=instance.project.id,
-                        organization_id=instance.project.organization.id,
-                        recipient=f"#{instance.project.organization.slug}",
-                        subject=f"Task assigned: {instance.title}",
-                        response_data=results['slack']
-                    )
-        
-        else:
-            # Task updated - check for changes
-            
-            # Check for assignment changes
-            if hasattr(instance, '_old_assignee') and instance._old_assignee != instance.assignee_email:
-                if instance.assignee_email:  # Task assigned to someone
-                    results = orchestrator.handle_task_assigned(instance, instance.assignee_email)
-                    
-                    log_integration(
-                        service='mock_email',
-                        event_type='task_assigned',
-                        task_id=instance.id,
-                        project_id=instance.project.id,
-                        organization_id=instance.project.organization.id,
-                        recipient=instance.assignee_email,
-                        subject=f"Task Assigned: {instance.title}",
-                        response_data=results.get('email', {})
-                    )
-                    
-                    log_integration(
-                        service='mock_slack',
-                        event_type='task_assigned',
-                        task_id=instance.id,
-                        project_id=instance.project.id,
-                        organization_id=instance.project.organization.id,
-                        recipient=f"#{instance.project.organization.slug}",
-                        subject=f"Task assigned: {instance.title}",
-                        response_data=results.get('slack', {})
-                    )
-            
-            # Check for status changes
-            if hasattr(instance, '_old_status') and instance._old_status != instance.status:
-                old_status = instance._old_status or 'NEW'
-                
-                # Send status change email
-                email_result = MockEmailService.send_status_change_email(instance, old_status, instance.status)
-                log_integration(
-                    service='mock_email',
-                    event_type='task_status_changed',
-                    task_id=instance.id,
-                    project_id=instance.project.id,
-                    organization_id=instance.project.organization.id,
-                    recipient=instance.assignee_email or "project-team@example.com",
-                    subject=f"Task Update: {instance.title}",
-                    response_data=email_result
-                )
-                
-                # Special handling for task completion
-                if instance.status == 'DONE':
-                    results = orchestrator.handle_task_completed(instance)
-                    
-                    log_integration(
-                        service='mock_slack',
-                        event_type='task_completed',
-                        task_id=instance.id,
-                        project_id=instance.project.id,
-                        organization_id=instance.project.organization.id,
-                        recipient=f"#{instance.project.organization.slug}",
-                        subject=f"Task completed: {instance.title}",
-                        response_data=results.get('slack', {})
-                    )
+        _get_orchestrator().handle_new_comment(task_comment)
     
     except Exception as e:
-        logger.error(f"Error handling task changes for task {instance.id}: {e}")
+        logger.error("Error handling new comment for task %s: %s", task_comment.task_id, e)
         
         # Log failed integration
         IntegrationLog.objects.create(
-            service='integration_orchestrator',
-            event_type='task_updated',
-            status='failed',
-            task_id=instance.id,
-            project_id=instance.project.id,
+            service=IntegrationLog.Service.MOCK_EMAIL,
+            event_type=IntegrationLog.EventType.COMMENT_ADDED,
+            status=IntegrationLog.Status.FAILED,
+            task_id=task_comment.task.id,
+            project_id=task_comment.task.project.id,
             error_message=str(e)
         )
 
 
 @receiver(post_save, sender=TaskComment)
 def handle_new_comment(sender, instance, created, **kwargs):
-    """Handle new task comments."""
+    """Schedule the integrations for a new task comment."""
     
     if not created:
         return
@@ -199,40 +225,59 @@ def handle_new_comment(sender, instance, created, **kwargs):
     except Exception:
         return
     
-    try:
-        orchestrator = IntegrationOrchestrator()
-        results = orchestrator.handle_new_comment(instance)
-        
-        # Log email integration
-        if 'email' in results:
-            log_integration(
-                service='mock_email',
-                event_type='comment_added',
-                task_id=instance.task.id,
-                project_id=instance.task.project.id,
-                organization_id=instance.task.project.organization.id,
-                recipient=instance.task.assignee_email or "project-team@example.com",
-                subject=f"New Comment: {instance.task.title}",
-                response_data=results['email']
-            )
+    transaction.on_commit(partial(dispatch_new_comment, instance), using=kwargs.get('using'))
+
+
+# (signal, receiver, sender) for every handler that fires integrations
+INTEGRATION_RECEIVERS = (
+    (pre_save, track_task_changes, Task),
+    (post_save, handle_task_changes, Task),
+    (post_save, handle_new_comment, TaskComment),
+)
+
+
+@contextmanager
+def integration_signals_paused():
+    """
+    Disconnect the integration signal handlers for the duration of the block.
     
-    except Exception as e:
-        logger.error(f"Error handling new comment for task {instance.task.id}: {e}")
-        
-        # Log failed integration
-        IntegrationLog.objects.create(
-            service='mock_email',
-            event_type='comment_added',
-            status='failed',
-            task_id=instance.task.id,
-            project_id=instance.task.project.id,
-            error_message=str(e)
-        )
+    For seed scripts, imports and management commands that save many tasks or
+    comments and don't want notifications: saves then cost no extra queries.
+    
+        with integration_signals_paused():
+            for row in rows:
+                Task.objects.create(**row)
+    
+    Handlers are reconnected on exit. Signal connections are process-wide,
+    so don't use this in code serving concurrent requests.
+    """
+    for signal, handler, sender in INTEGRATION_RECEIVERS:
+        signal.disconnect(handler, sender=sender)
+    try:
+        yield
+    finally:
+        for signal, handler, sender in INTEGRATION_RECEIVERS:
+            signal.connect(handler, sender=sender)
+
+
+@receiver([post_save, post_delete], sender=IntegrationSettings)
+def invalidate_integration_settings_cache(sender, instance, **kwargs):
+    """Drop cached service flags whenever a setting changes."""
+    cache.delete_many([IntegrationSettings.cache_key(instance.service_name)])
+
+
+@receiver([post_save, post_delete], sender=Organization)
+def invalidate_organization_slug_cache(sender, instance, **kwargs):
+    """Forget an organization's cached slug whenever it changes."""
+    from .services import organization_slug_cache_key
+    cache.delete(organization_slug_cache_key(instance.pk))
 
 
 # Management command helper for testing integrations
 def test_all_integrations():
     """Helper function to test all integration services (for management commands)."""
+    from .services import MockEmailService, MockSlackService
+    
     print("🧪 Testing Mock Integration Services...")
     
     try:
@@ -251,17 +296,19 @@ def test_all_integrations():
 
 
 # Initialize default settings
-def create_default_integration_settings():
-    """Create default integration settings if they don't exist."""
+def create_default_integration_settings(**kwargs):
+    """Create default integration settings if they don't exist (run on post_migrate)."""
     try:
         from django.db import connection
         # Check if tables exist before trying to create settings
         if 'integrations_integrationsettings' in connection.introspection.table_names():
+            # is_mock_mode has no column (the classmethod of the same name
+            # shadows the field), so only seed the enabled flag
             defaults = [
-                {'service_name': 'mock_email', 'is_enabled': True, 'is_mock_mode': True},
-                {'service_name': 'mock_slack', 'is_enabled': True, 'is_mock_mode': True},
-                {'service_name': 'email', 'is_enabled': False, 'is_mock_mode': False},
-                {'service_name': 'slack', 'is_enabled': False, 'is_mock_mode': False},
+                {'service_name': 'mock_email', 'is_enabled': True},
+                {'service_name': 'mock_slack', 'is_enabled': True},
+                {'service_name': 'email', 'is_enabled': False},
+                {'service_name': 'slack', 'is_enabled': False},
             ]
             
             for default in defaults:
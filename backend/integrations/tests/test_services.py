@@ -2,37 +2,33 @@
 Tests for integration services (MockEmailService, MockSlackService).
 """
 
-from django.test import TestCase
+from datetime import date, datetime, timezone as dt_timezone
+from unittest import skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from integrations.partitions import (
+    DEFAULT_PARTITION, LOG_TABLE, add_months, create_month_partition, month_start, partition_name,
+)
+from integrations.signals import integration_signals_paused
 from integrations.services import MockEmailService, MockSlackService, IntegrationOrchestrator
 from integrations.models import IntegrationLog, IntegrationSettings
-from organizations.models import Organization
-from projects.models import Project
 from tasks.models import Task, TaskComment
+from tests.factories import create_organization, create_project, create_task
 
 
 class MockEmailServiceTest(TestCase):
     """Test MockEmailService functionality."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.organization = Organization.objects.create(
-            name='Test Organization',
-            slug='test-org',
-            contact_email='contact@testorg.com'
-        )
-        
-        self.project = Project.objects.create(
-            organization=self.organization,
-            name='Test Project',
-            status='ACTIVE'
-        )
-        
-        self.task = Task.objects.create(
-            project=self.project,
-            title='Test Task',
-            status='TODO',
-            assignee_email='assignee@example.com'
-        )
+        cls.organization = create_organization()
+        cls.project = create_project(cls.organization)
+        cls.task = create_task(cls.project, assignee_email='assignee@example.com')
 
     def test_send_task_assignment_email(self):
         """Test sending task assignment email."""
@@ -90,26 +86,12 @@ class MockEmailServiceTest(TestCase):
 class MockSlackServiceTest(TestCase):
     """Test MockSlackService functionality."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.organization = Organization.objects.create(
-            name='Test Organization',
-            slug='test-org',
-            contact_email='contact@testorg.com'
-        )
-        
-        self.project = Project.objects.create(
-            organization=self.organization,
-            name='Test Project',
-            status='ACTIVE'
-        )
-        
-        self.task = Task.objects.create(
-            project=self.project,
-            title='Test Task',
-            status='TODO',
-            assignee_email='assignee@example.com'
-        )
+        cls.organization = create_organization()
+        cls.project = create_project(cls.organization)
+        cls.task = create_task(cls.project, assignee_email='assignee@example.com')
 
     def test_post_task_assignment(self):
         """Test posting task assignment to Slack."""
@@ -159,27 +141,15 @@ class MockSlackServiceTest(TestCase):
 class IntegrationOrchestratorTest(TestCase):
     """Test IntegrationOrchestrator functionality."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.organization = Organization.objects.create(
-            name='Test Organization',
-            slug='test-org',
-            contact_email='contact@testorg.com'
-        )
-        
-        self.project = Project.objects.create(
-            organization=self.organization,
-            name='Test Project',
-            status='ACTIVE'
-        )
-        
-        self.task = Task.objects.create(
-            project=self.project,
-            title='Test Task',
-            status='TODO',
-            assignee_email='assignee@example.com'
-        )
-        
+        cls.organization = create_organization()
+        cls.project = create_project(cls.organization)
+        cls.task = create_task(cls.project, assignee_email='assignee@example.com')
+
+    def setUp(self):
+        """Set up the orchestrator."""
         self.orchestrator = IntegrationOrchestrator()
 
     def test_handle_task_assigned(self):
@@ -202,6 +172,56 @@ class IntegrationOrchestratorTest(TestCase):
         slack_result = results['slack']
         self.assertEqual(slack_result['status'], 'posted')
         self.assertEqual(slack_result['channel'], f'#{self.organization.slug}')
+        
+        # Both services share one event timestamp
+        self.assertEqual(email_result['timestamp'], slack_result['timestamp'])
+
+    def test_handle_task_assigned_logs_in_one_insert(self):
+        """Test that one log row per service is written in a single query."""
+        IntegrationLog.objects.all().delete()
+        
+        with self.assertNumQueries(1):
+            self.orchestrator.handle_task_assigned(self.task, 'assignee@example.com')
+        
+        logs = IntegrationLog.objects.filter(task=self.task, event_type=IntegrationLog.EventType.TASK_ASSIGNED)
+        self.assertEqual(
+            sorted(logs.values_list('service', flat=True)),
+            [IntegrationLog.Service.MOCK_EMAIL, IntegrationLog.Service.MOCK_SLACK]
+        )
+        self.assertEqual(logs.get(service=IntegrationLog.Service.MOCK_SLACK).recipient, f'#{self.organization.slug}')
+
+    def test_disabled_service_is_skipped(self):
+        """Test that a service disabled in settings is not called or logged."""
+        self.addCleanup(cache.clear)
+        setting = IntegrationSettings.objects.get(service_name='mock_slack')
+        setting.is_enabled = False
+        setting.save()
+        IntegrationLog.objects.all().delete()
+        
+        results = self.orchestrator.handle_task_assigned(self.task, 'assignee@example.com')
+        
+        self.assertEqual(results['email']['status'], 'sent')
+        self.assertEqual(results['slack']['status'], 'skipped')
+        self.assertEqual(
+            list(IntegrationLog.objects.values_list('service', flat=True)),
+            [IntegrationLog.Service.MOCK_EMAIL]
+        )
+
+    def test_channel_resolved_from_cached_slug(self):
+        """Test that a task without its organization loaded reuses the cached slug and sees renames."""
+        task = Task.objects.get(pk=self.task.pk)
+        self.orchestrator.handle_task_assigned(task, 'assignee@example.com')  # warms the cache
+        
+        task = Task.objects.select_related('project').get(pk=self.task.pk)
+        with self.assertNumQueries(1):  # just the log INSERT
+            results = self.orchestrator.handle_task_assigned(task, 'assignee@example.com')
+        self.assertEqual(results['slack']['channel'], '#test-org')
+        
+        self.addCleanup(cache.clear)  # the rename is rolled back, the cache isn't
+        self.organization.slug = 'renamed-org'
+        self.organization.save()
+        results = self.orchestrator.handle_task_assigned(task, 'assignee@example.com')
+        self.assertEqual(results['slack']['channel'], '#renamed-org')
 
     def test_handle_task_completed(self):
         """Test handling task completion with multiple integrations."""
@@ -239,74 +259,200 @@ class IntegrationOrchestratorTest(TestCase):
         self.assertEqual(email_result['comment_author'], 'commenter@example.com')
 
 
+class TaskSignalTest(TestCase):
+    """Test the Task save signals that drive the integrations."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.organization = create_organization()
+        cls.project = create_project(cls.organization)
+        cls.task = create_task(cls.project)
+
+    def test_status_change_logs_with_prefetched_organization(self):
+        """Test that a status change on a bare instance reuses the pre_save organization lookup."""
+        task = Task.objects.get(pk=self.task.pk)  # project/organization not loaded
+        task.status = 'IN_PROGRESS'
+        with self.captureOnCommitCallbacks(execute=True):
+            task.save()
+        
+        self.assertEqual(task._cached_org_slug, self.organization.slug)
+        log = IntegrationLog.objects.get(task=task, event_type=IntegrationLog.EventType.TASK_STATUS_CHANGED)
+        self.assertEqual(log.organization_id, self.organization.id)
+        self.assertEqual(log.project_id, self.project.id)
+
+    def test_status_change_email_respects_disabled_service(self):
+        """Test that a status change sends and logs no email while mock_email is disabled."""
+        self.addCleanup(cache.clear)
+        IntegrationSettings.objects.filter(service_name='mock_email').update(is_enabled=False)
+        cache.clear()
+
+        self.task.status = 'IN_PROGRESS'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.save()
+
+        self.assertFalse(IntegrationLog.objects.filter(task=self.task).exists())
+
+    def test_untracked_update_fields_skip_signal_work(self):
+        """Test that saving only unrelated fields neither queries the old row nor schedules integrations."""
+        self.task.status = 'IN_PROGRESS'  # changed, but not part of this save
+        self.task.description = 'Updated description'
+        with self.assertNumQueries(1), self.captureOnCommitCallbacks() as callbacks:
+            self.task.save(update_fields=['description', 'updated_at'])
+        
+        self.assertEqual(callbacks, [])
+
+    def test_paused_signals_skip_integrations(self):
+        """Test that saves inside integration_signals_paused() trigger nothing, and handlers come back after."""
+        with integration_signals_paused():
+            with self.assertNumQueries(1), self.captureOnCommitCallbacks() as callbacks:
+                Task.objects.create(project=self.project, title='Imported', assignee_email='a@example.com')
+        self.assertEqual(callbacks, [])
+        
+        with self.captureOnCommitCallbacks() as callbacks:
+            Task.objects.create(project=self.project, title='Regular', assignee_email='a@example.com')
+        self.assertEqual(len(callbacks), 1)
+
+    def test_integrations_run_after_commit(self):
+        """Test that nothing is sent or logged until the save commits."""
+        self.task.assignee_email = 'assignee@example.com'
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.task.save()
+            self.assertFalse(IntegrationLog.objects.filter(task=self.task).exists())
+        
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertTrue(
+            IntegrationLog.objects.filter(task=self.task, event_type=IntegrationLog.EventType.TASK_ASSIGNED).exists()
+        )
+
+    def test_completion_logs_written_in_one_insert(self):
+        """Test that every log row produced by one save goes out in a single INSERT."""
+        self.task.status = 'DONE'
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            self.task.save()
+        
+        inserts = [q['sql'] for q in queries if q['sql'].startswith('INSERT INTO "integrations_integrationlog"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(
+            sorted(IntegrationLog.objects.filter(task=self.task).values_list('event_type', flat=True)),
+            [IntegrationLog.EventType.TASK_STATUS_CHANGED, IntegrationLog.EventType.TASK_COMPLETED]
+        )
+        # The completion row is Slack's; the email is the status-change row
+        self.assertEqual(
+            IntegrationLog.objects.get(task=self.task, event_type=IntegrationLog.EventType.TASK_COMPLETED).service,
+            IntegrationLog.Service.MOCK_SLACK
+        )
+
+
 class IntegrationLogModelTest(TestCase):
     """Test IntegrationLog model."""
 
     def test_integration_log_creation(self):
         """Test creating an integration log."""
+        organization = create_organization()
+        project = create_project(organization)
+        task = create_task(project)
+        
         log = IntegrationLog.objects.create(
-            service='mock_email',
-            event_type='task_assigned',
-            status='success',
-            task_id=1,
-            project_id=1,
+            service=IntegrationLog.Service.MOCK_EMAIL,
+            event_type=IntegrationLog.EventType.TASK_ASSIGNED,
+            status=IntegrationLog.Status.SUCCESS,
+            task=task,
+            project=project,
+            organization=organization,
             recipient='test@example.com',
             subject='Test Subject',
             response_data={'status': 'sent'},
             response_time_ms=150
         )
         
-        self.assertEqual(log.service, 'mock_email')
-        self.assertEqual(log.event_type, 'task_assigned')
-        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.service, IntegrationLog.Service.MOCK_EMAIL)
+        self.assertEqual(log.event_type, IntegrationLog.EventType.TASK_ASSIGNED)
+        self.assertEqual(log.status, IntegrationLog.Status.SUCCESS)
+        self.assertEqual(log.get_status_display(), 'Success')
         self.assertTrue(log.is_successful)
         self.assertEqual(log.response_time_ms, 150)
+        self.assertEqual(log.task_id, task.id)
+        self.assertTrue(task.integration_logs.filter(pk=log.pk).exists())
+
+    def test_log_keeps_ids_of_deleted_objects(self):
+        """Test that deleting a task, project or organization leaves its logs' IDs in place."""
+        task = create_task()
+        project, organization = task.project, task.project.organization
+        log = IntegrationLog.objects.create(
+            service=IntegrationLog.Service.MOCK_EMAIL,
+            event_type=IntegrationLog.EventType.TASK_ASSIGNED,
+            task=task,
+            project=project,
+            organization=organization
+        )
+        ids = (task.id, project.id, organization.id)
+        
+        organization.delete()  # cascades to the project and task
+        
+        log.refresh_from_db()
+        self.assertEqual((log.task_id, log.project_id, log.organization_id), ids)
 
     def test_mark_as_failed(self):
         """Test marking integration log as failed."""
         log = IntegrationLog.objects.create(
-            service='mock_slack',
-            event_type='task_completed',
-            status='success'
+            service=IntegrationLog.Service.MOCK_SLACK,
+            event_type=IntegrationLog.EventType.TASK_COMPLETED,
+            status=IntegrationLog.Status.SUCCESS
         )
         
         log.mark_as_failed('Network timeout error')
         
-        self.assertEqual(log.status, 'failed')
+        self.assertEqual(log.status, IntegrationLog.Status.FAILED)
         self.assertEqual(log.error_message, 'Network timeout error')
         self.assertFalse(log.is_successful)
+        
+        # Changes should be persisted, not just set on the instance
+        log.refresh_from_db()
+        self.assertEqual(log.status, IntegrationLog.Status.FAILED)
+        self.assertEqual(log.error_message, 'Network timeout error')
 
     def test_mark_as_success(self):
         """Test marking integration log as successful."""
         log = IntegrationLog.objects.create(
-            service='mock_email',
-            event_type='comment_added',
-            status='pending'
+            service=IntegrationLog.Service.MOCK_EMAIL,
+            event_type=IntegrationLog.EventType.COMMENT_ADDED,
+            status=IntegrationLog.Status.PENDING
         )
         
         response_data = {'status': 'sent', 'message_id': '123'}
         log.mark_as_success(response_data)
         
-        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.status, IntegrationLog.Status.SUCCESS)
         self.assertEqual(log.response_data, response_data)
         self.assertTrue(log.is_successful)
+        
+        log.refresh_from_db()
+        self.assertEqual(log.status, IntegrationLog.Status.SUCCESS)
+        self.assertEqual(log.response_data, response_data)
 
 
 class IntegrationSettingsModelTest(TestCase):
     """Test IntegrationSettings model."""
 
+    def setUp(self):
+        """Start and end each test with no cached service flags."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+
     def test_is_service_enabled(self):
         """Test checking if service is enabled."""
         # Create enabled service
-        IntegrationSettings.objects.create(
+        IntegrationSettings.objects.update_or_create(
             service_name='mock_email',
-            is_enabled=True
+            defaults={'is_enabled': True}
         )
         
         # Create disabled service
-        IntegrationSettings.objects.create(
+        IntegrationSettings.objects.update_or_create(
             service_name='mock_slack',
-            is_enabled=False
+            defaults={'is_enabled': False}
         )
         
         # Test enabled service
@@ -322,11 +468,37 @@ class IntegrationSettingsModelTest(TestCase):
         # Test non-existent service (should default to mock)
         self.assertTrue(IntegrationSettings.is_mock_mode('non_existent'))
 
+    def test_default_settings_seeded_after_migrate(self):
+        """Test that post_migrate seeds the default service settings."""
+        self.assertTrue(IntegrationSettings.is_service_enabled('mock_email'))
+        self.assertTrue(IntegrationSettings.is_service_enabled('mock_slack'))
+        self.assertFalse(IntegrationSettings.is_service_enabled('email'))
+        self.assertFalse(IntegrationSettings.is_service_enabled('slack'))
+
+    def test_service_flags_are_cached_and_invalidated(self):
+        """Test that lookups are cached and refreshed when a setting changes."""
+        setting, _ = IntegrationSettings.objects.update_or_create(
+            service_name='mock_email',
+            defaults={'is_enabled': True}
+        )
+        
+        self.assertTrue(IntegrationSettings.is_service_enabled('mock_email'))
+        with self.assertNumQueries(0):
+            self.assertTrue(IntegrationSettings.is_service_enabled('mock_email'))
+        
+        setting.is_enabled = False
+        setting.save()
+        self.assertFalse(IntegrationSettings.is_service_enabled('mock_email'))
+        
+        setting.delete()
+        self.assertFalse(IntegrationSettings.is_service_enabled('mock_email'))
+        self.assertTrue(IntegrationSettings.is_mock_mode('mock_email'))
+
     def test_integration_settings_string_representation(self):
         """Test string representation of IntegrationSettings."""
-        setting = IntegrationSettings.objects.create(
+        setting, _ = IntegrationSettings.objects.update_or_create(
             service_name='mock_email',
-            is_enabled=True
+            defaults={'is_enabled': True}
         )
         
         expected_str = 'mock_email (Enabled)'
@@ -337,4 +509,47 @@ class IntegrationSettingsModelTest(TestCase):
         setting.save()
         
         expected_str = 'mock_email (Disabled)'
-        self.assertEqual(str(setting), expected_str)
\ No newline at end of file
+        self.assertEqual(str(setting), expected_str)
+
+
+class LogPartitionHelpersTest(SimpleTestCase):
+    """Test the month arithmetic behind the log partitions."""
+
+    def test_month_boundaries(self):
+        """Test month start, year rollover and partition naming."""
+        self.assertEqual(month_start(date(2026, 12, 31)), date(2026, 12, 1))
+        self.assertEqual(add_months(date(2026, 12, 1), 1), date(2027, 1, 1))
+        self.assertEqual(add_months(date(2026, 1, 1), -1), date(2025, 12, 1))
+        self.assertEqual(partition_name(date(2026, 3, 1)), 'integrations_integrationlog_202603')
+
+
+@skipUnless(connection.vendor == 'postgresql', "the log table is only partitioned on PostgreSQL")
+class LogPartitionTest(TestCase):
+    """Test creating monthly partitions on the partitioned log table."""
+
+    def test_partition_takes_over_rows_from_default(self):
+        """Test that creating a month whose rows already sit in the DEFAULT partition moves them into it."""
+        month = add_months(month_start(timezone.now()), 24)  # well past the pre-created months
+        log = IntegrationLog.objects.create(
+            service=IntegrationLog.Service.MOCK_EMAIL,
+            event_type=IntegrationLog.EventType.TASK_ASSIGNED,
+        )
+        IntegrationLog.objects.filter(pk=log.pk).update(
+            created_at=datetime(month.year, month.month, 15, tzinfo=dt_timezone.utc)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT tableoid::regclass::text FROM "{LOG_TABLE}" WHERE id = %s', [log.pk])
+            self.assertEqual(cursor.fetchone()[0], DEFAULT_PARTITION)
+
+            create_month_partition(cursor, month)
+
+            cursor.execute(f'SELECT tableoid::regclass::text FROM "{LOG_TABLE}" WHERE id = %s', [log.pk])
+            self.assertEqual(cursor.fetchone()[0], partition_name(month))
+            # ...and the DEFAULT partition is attached again
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM pg_inherits WHERE inhrelid = to_regclass(%s) "
+                "AND inhparent = to_regclass(%s))",
+                [DEFAULT_PARTITION, LOG_TABLE]
+            )
+            self.assertTrue(cursor.fetchone()[0])
@@ -17,6 +17,17 @@ class Organization(models.Model):
         return self.name
 
     def save(self, *args, **kwargs):
+        """
+        Fill in the slug from the name when it's missing.
+        
+        A generated slug is added to ``update_fields`` so partial saves persist
+        it. ``bulk_create`` doesn't call save(): bulk loaders should set
+        ``slug`` themselves (e.g. ``slugify(name)``) and may pass
+        ``ignore_conflicts=True`` to skip rows whose slug already exists.
+        """
         if not self.slug:
             self.slug = slugify(self.name)
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None and 'slug' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'slug']
         super().save(*args, **kwargs)
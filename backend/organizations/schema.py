@@ -1,8 +1,29 @@
 import graphene
-from graphene_django import DjangoObjectType
+from graphene import relay
+from graphene_django import DjangoConnectionField, DjangoObjectType
+from project_management.loaders import RequestLoader, get_loader
+from project_management.selection import only_selected
 from .models import Organization
 
 
+# Upper bound for the unpaginated organizationList; the organizations connection pages past it
+ORGANIZATION_LIST_LIMIT = 100
+
+
+class OrganizationBySlugLoader(RequestLoader):
+    """Organizations by slug, shared by every resolver in a request (None for unknown slugs)."""
+
+    def fetch(self, slug):
+        return Organization.objects.filter(slug=slug).first()
+
+
+class OrganizationByIdLoader(RequestLoader):
+    """Organizations by primary key, so foreign keys to the same organization hit the DB once per request."""
+
+    def fetch(self, id):
+        return Organization.objects.filter(pk=id).first()
+
+
 class OrganizationType(DjangoObjectType):
     """
     Represents an organization that serves as a multi-tenant container for projects and tasks.
@@ -14,10 +35,27 @@ class OrganizationType(DjangoObjectType):
         description = "An organization that contains projects and provides multi-tenant data isolation"
 
 
+class OrganizationNode(DjangoObjectType):
+    """
+    Relay node view of an organization, used by the paginated ``organizations`` connection.
+    Its ``id`` is a global relay ID; use ``OrganizationType`` elsewhere.
+    """
+    class Meta:
+        model = Organization
+        fields = ("id", "name", "slug", "contact_email", "created_at")
+        interfaces = (relay.Node,)
+        skip_registry = True  # keep OrganizationType as the type for Organization foreign keys
+        description = "An organization exposed as a relay node for cursor pagination"
+
+
 class Query(graphene.ObjectType):
     organization_list = graphene.List(
         OrganizationType,
-        description="Retrieve all organizations in the system"
+        description=f"Retrieve organizations ordered by name (at most {ORGANIZATION_LIST_LIMIT}; use organizations to paginate)"
+    )
+    organizations = DjangoConnectionField(
+        OrganizationNode,
+        description="Paginated organizations ordered by name (relay connection: first/after, last/before)"
     )
     organization_detail = graphene.Field(
         OrganizationType, 
@@ -26,13 +64,13 @@ class Query(graphene.ObjectType):
     )
 
     def resolve_organization_list(self, info):
-        return Organization.objects.all()
+        return only_selected(Organization.objects.order_by('name'), info)[:ORGANIZATION_LIST_LIMIT]
+
+    def resolve_organizations(self, info, **kwargs):
+        return Organization.objects.order_by('name')
 
     def resolve_organization_detail(self, info, slug):
-        try:
-            return Organization.objects.get(slug=slug)
-        except Organization.DoesNotExist:
-            return None
+        return get_loader(info, OrganizationBySlugLoader).load(slug)
 
 
 class CreateOrganization(graphene.Mutation):
@@ -83,26 +121,30 @@ class UpdateOrganization(graphene.Mutation):
 
     def mutate(self, info, id, name=None, contact_email=None):
         try:
-            organization = Organization.objects.get(pk=id)
+            organization = Organization.objects.filter(pk=id).first()
+            if organization is None:
+                return UpdateOrganization(
+                    organization=None,
+                    success=False,
+                    errors=["Organization not found"]
+                )
             
+            changed = []
             if name is not None:
                 organization.name = name
+                changed.append('name')
             if contact_email is not None:
                 organization.contact_email = contact_email
+                changed.append('contact_email')
                 
-            organization.save()
+            if changed:
+                organization.save(update_fields=changed)
             
             return UpdateOrganization(
                 organization=organization,
                 success=True,
                 errors=[]
             )
-        except Organization.DoesNotExist:
-            return UpdateOrganization(
-                organization=None,
-                success=False,
-                errors=["Organization not found"]
-            )
         except Exception as e:
             return UpdateOrganization(
                 organization=None,
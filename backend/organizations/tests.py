@@ -45,6 +45,18 @@ class OrganizationModelTest(TestCase):
                 contact_email='another@testorg.com'
             )
 
+    def test_slug_generated_from_name(self):
+        """Test that a missing slug is derived from the name, also on partial saves."""
+        org = Organization.objects.create(name='Acme Widgets', contact_email='hi@acme.com')
+        self.assertEqual(org.slug, 'acme-widgets')
+        
+        Organization.objects.filter(pk=org.pk).update(slug='')
+        org.slug = ''
+        org.name = 'Acme Gadgets'
+        org.save(update_fields=['name'])
+        org.refresh_from_db()
+        self.assertEqual(org.slug, 'acme-gadgets')
+
     def test_email_validation(self):
         """Test email field validation."""
         # Test with invalid email
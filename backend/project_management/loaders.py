@@ -0,0 +1,51 @@
+"""
+Per-request loaders for GraphQL resolvers.
+
+graphene-django's GraphQLView executes synchronously, so there is no tick to
+collect sibling resolvers' keys into one batch the way asyncio DataLoaders do.
+A loader is a request-scoped memo instead: the first ``load`` of a key runs
+one query, and every later ``load`` of it in the same request is answered
+from memory.
+"""
+
+
+class RequestLoader:
+    """Base loader; subclasses implement ``fetch(key) -> value or None``."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def fetch(self, key):
+        raise NotImplementedError
+
+    def load(self, key):
+        if key not in self._cache:
+            self._cache[key] = self.fetch(key)
+        return self._cache[key]
+
+
+def _context_dict(info, name):
+    """The request context's dict attribute (or key) ``name``, created on first use."""
+    context = info.context
+    if context is None:
+        return {}
+    if isinstance(context, dict):
+        return context.setdefault(name, {})
+    value = getattr(context, name, None)
+    if value is None:
+        value = {}
+        setattr(context, name, value)
+    return value
+
+
+def get_loader(info, loader_class):
+    """The request's instance of ``loader_class`` (a fresh one when there's no request context)."""
+    loaders = _context_dict(info, 'loaders')
+    if loader_class not in loaders:
+        loaders[loader_class] = loader_class()
+    return loaders[loader_class]
+
+
+def request_memo(info):
+    """Dict for values computed once per request (a throwaway dict when there's no request context)."""
+    return _context_dict(info, 'memo')
@@ -0,0 +1,113 @@
+"""
+Parsed-and-validated GraphQL document cache.
+
+The SPA sends the same handful of operations over and over, so the schema
+keeps the parsed document and its validation errors per query string and
+goes straight to execution on a repeat. CachedDocumentView puts the cache in
+front of the HTTP endpoint: graphene-django's view parses every request
+itself before calling the schema.
+"""
+
+from functools import lru_cache
+
+import graphene
+from django.db import connection, transaction
+from django.http import HttpResponseBadRequest, HttpResponseNotAllowed
+from graphene.types.schema import normalize_execute_kwargs
+from graphene_django.constants import MUTATION_ERRORS_FLAG
+from graphene_django.settings import graphene_settings
+from graphene_django.views import GraphQLView, HttpError
+from graphql import (
+    DocumentNode, ExecutionResult, GraphQLError, OperationType, execute_sync, get_operation_ast, parse, validate,
+)
+
+DOCUMENT_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=DOCUMENT_CACHE_SIZE)
+def parse_and_validate(graphql_schema, source):
+    """(document, errors) for a query string; syntax errors come back with no document."""
+    try:
+        document = parse(source)
+    except GraphQLError as error:
+        return None, (error,)
+    return document, tuple(validate(graphql_schema, document))
+
+
+class CachedDocumentSchema(graphene.Schema):
+    """
+    graphene.Schema whose execute() skips parse/validate for query strings it has seen.
+
+    Also accepts a DocumentNode that already came out of parse_and_validate,
+    which it runs as is.
+    """
+
+    def execute(self, source, **kwargs):
+        if isinstance(source, str):
+            document, errors = parse_and_validate(self.graphql_schema, source)
+            if errors:
+                return ExecutionResult(data=None, errors=list(errors))
+        elif isinstance(source, DocumentNode):
+            document = source
+        else:
+            return super().execute(source, **kwargs)
+        return execute_sync(self.graphql_schema, document, **normalize_execute_kwargs(kwargs))
+
+
+class CachedDocumentView(GraphQLView):
+    """
+    GraphQLView that takes the document from parse_and_validate instead of
+    parsing every request, and hands it on to the schema.
+
+    Otherwise the same as graphene-django's execute_graphql_request: GET only
+    runs queries, and mutations are atomic when ATOMIC_MUTATIONS is set.
+    """
+
+    def execute_graphql_request(self, request, data, query, variables, operation_name, show_graphiql=False):
+        if not query:
+            if show_graphiql:
+                return None
+            raise HttpError(HttpResponseBadRequest("Must provide query string."))
+
+        document, errors = parse_and_validate(self.schema.graphql_schema, query)
+        if errors:
+            return ExecutionResult(data=None, errors=list(errors))
+
+        operation_ast = get_operation_ast(document, operation_name)
+        if request.method.lower() == "get" and operation_ast and operation_ast.operation != OperationType.QUERY:
+            if show_graphiql:
+                return None
+            raise HttpError(HttpResponseNotAllowed(
+                ["POST"],
+                f"Can only perform a {operation_ast.operation.value} operation from a POST request."
+            ))
+
+        try:
+            options = {
+                "source": document,
+                "root_value": self.get_root_value(request),
+                "variable_values": variables,
+                "operation_name": operation_name,
+                "context_value": self.get_context(request),
+                "middleware": self.get_middleware(request),
+            }
+            if self.execution_context_class:
+                options["execution_context_class"] = self.execution_context_class
+
+            if (
+                operation_ast
+                and operation_ast.operation == OperationType.MUTATION
+                and (
+                    graphene_settings.ATOMIC_MUTATIONS is True
+                    or connection.settings_dict.get("ATOMIC_MUTATIONS", False) is True
+                )
+            ):
+                with transaction.atomic():
+                    result = self.schema.execute(**options)
+                    if getattr(request, MUTATION_ERRORS_FLAG, False) is True:
+                        transaction.set_rollback(True)
+                return result
+
+            return self.schema.execute(**options)
+        except Exception as e:
+            return ExecutionResult(errors=[e])
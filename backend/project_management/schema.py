@@ -2,6 +2,7 @@ import graphene
 import organizations.schema
 import projects.schema
 import tasks.schema
+from project_management.query_cache import CachedDocumentSchema
 
 
 class Query(
@@ -23,4 +24,4 @@ class Mutation(
     pass
 
 
-schema = graphene.Schema(query=Query, mutation=Mutation)
\ No newline at end of file
+schema = CachedDocumentSchema(query=Query, mutation=Mutation)
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Helpers for shaping ORM querysets from the GraphQL selection set.
+
+Resolvers use these to fetch only the columns, joins and annotations the
+client actually asked for, instead of always loading full rows.
+"""
+
+from graphene.utils.str_converters import to_snake_case
+from graphql.language import FieldNode, FragmentSpreadNode, InlineFragmentNode
+
+
+def _collect(selection_set, fragments, tree):
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            subtree = tree.setdefault(to_snake_case(selection.name.value), {})
+            if selection.selection_set is not None:
+                _collect(selection.selection_set, fragments, subtree)
+        elif isinstance(selection, FragmentSpreadNode):
+            _collect(fragments[selection.name.value].selection_set, fragments, tree)
+        elif isinstance(selection, InlineFragmentNode):
+            _collect(selection.selection_set, fragments, tree)
+
+
+def selection_tree(info):
+    """
+    The selection under the field being resolved as nested dicts of snake_case
+    names, e.g. ``{'title': {}, 'project': {'organization': {'slug': {}}}}``
+    (fragments included).
+    """
+    tree = {}
+    for field_node in info.field_nodes:
+        if field_node.selection_set is not None:
+            _collect(field_node.selection_set, info.fragments, tree)
+    return tree
+
+
+def selected_fields(info):
+    """snake_case names of the fields selected under the field being resolved (fragments included)."""
+    return set(selection_tree(info))
+
+
+def client_wants(info, name):
+    """Whether the selection under the field being resolved includes ``name`` (e.g. a mutation payload field)."""
+    return name in selection_tree(info)
+
+
+def only_selected(queryset, info, *always):
+    """Defer every concrete column the selection doesn't ask for (the pk is always loaded)."""
+    opts = queryset.model._meta
+    concrete = {field.name for field in opts.concrete_fields}
+    columns = (selected_fields(info) & concrete) | set(always)
+    return queryset.only(opts.pk.name, *columns)
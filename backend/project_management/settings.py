@@ -28,6 +28,8 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    # Registers OpClass for the trigram GIN indexes on IntegrationLog
+    'django.contrib.postgres',
     
     # Third party apps -
     'rest_framework',
@@ -117,6 +119,26 @@ GRAPHENE = {
     'SCHEMA': 'project_management.schema.schema',
 }
 
+# Logging - mock integration messages go through the 'integrations' logger.
+# Set INTEGRATIONS_LOG_LEVEL=WARNING to silence them (messages are formatted lazily,
+# so muted calls cost almost nothing)
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'integrations': {
+            'handlers': ['console'],
+            'level': os.getenv('INTEGRATIONS_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
+
 # CORS settings for React frontend - YOU WERE MISSING THESE!
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
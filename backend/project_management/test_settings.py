@@ -0,0 +1,23 @@
+"""
+Django settings for running the test suite.
+
+Uses the same PostgreSQL database settings as development: the integration
+log partitioning and the task foreign key migrations are PostgreSQL-specific,
+so the test database is still built by the real migrations. Run with --keepdb
+to build it once and reuse it across runs:
+
+    python manage.py test --settings=project_management.test_settings --keepdb
+"""
+
+import copy
+
+from .settings import *  # noqa: F401,F403
+
+# Tests never need a slow password hash
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Keep the mock integration messages out of test output (assertLogs still sees them)
+LOGGING = copy.deepcopy(LOGGING)
+LOGGING['loggers']['integrations']['level'] = 'WARNING'
@@ -1,9 +1,9 @@
 from django.contrib import admin
 from django.urls import path
-from graphene_django.views import GraphQLView
 from django.views.decorators.csrf import csrf_exempt
+from project_management.query_cache import CachedDocumentView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('graphql/', csrf_exempt(GraphQLView.as_view(graphiql=True))),
-]
\ No newline at end of file
+    path('graphql/', csrf_exempt(CachedDocumentView.as_view(graphiql=True))),
+]
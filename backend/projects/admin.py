@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count, Q
 from .models import Project
 
 
@@ -26,3 +27,10 @@ class ProjectAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+    def get_queryset(self, request):
+        # Task counts for the list columns come back with the projects instead of per row
+        return super().get_queryset(request).annotate(
+            task_count_ann=Count('tasks'),
+            completed_tasks_ann=Count('tasks', filter=Q(tasks__status='DONE'))
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 10:12
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='project',
+            index=models.Index(fields=['organization', '-created_at'], name='proj_org_created_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Count, Q
 from organizations.models import Organization
 
 
@@ -32,21 +33,37 @@ class Project(models.Model):
         indexes = [
             models.Index(fields=['organization', 'status']),
             models.Index(fields=['due_date']),
+            models.Index(fields=['organization', '-created_at'], name='proj_org_created_idx'),
         ]
 
     def __str__(self):
         return f"{self.organization.name} - {self.name}"
 
+    @property
+    def _task_stats(self):
+        """
+        (total, done) task counts for this instance. Uses the task_count_ann /
+        completed_tasks_ann annotations when the queryset provided them, else one
+        aggregate query per access, so the counts are never older than the call.
+        """
+        total = getattr(self, 'task_count_ann', None)
+        done = getattr(self, 'completed_tasks_ann', None)
+        if total is None or done is None:
+            stats = self.tasks.aggregate(total=Count('id'), done=Count('id', filter=Q(status='DONE')))
+            total, done = stats['total'], stats['done']
+        return total, done
+
     @property
     def task_count(self):
-        return self.tasks.count()
+        return self._task_stats[0]
 
     @property
     def completed_tasks(self):
-        return self.tasks.filter(status='DONE').count()
+        return self._task_stats[1]
 
     @property
     def completion_percentage(self):
-        if self.task_count == 0:
+        total, done = self._task_stats
+        if total == 0:
             return 0
-        return round((self.completed_tasks / self.task_count) * 100, 1)
+        return round((done / total) * 100, 1)
@@ -1,8 +1,27 @@
 import graphene
 from graphene_django import DjangoObjectType
+from graphql import GraphQLError
+from django.db import transaction
 from django.db.models import Count, Q
+from django.utils import timezone
 from .models import Project
+from tasks.models import Task
 from organizations.models import Organization
+from organizations.schema import OrganizationByIdLoader
+from project_management.loaders import RequestLoader, get_loader
+from project_management.selection import client_wants, only_selected, selected_fields
+
+_VALID_STATUSES = frozenset(status for status, _ in Project.STATUS_CHOICES)
+_INVALID_STATUS_ERROR = f"Invalid status. Must be one of: {', '.join(status for status, _ in Project.STATUS_CHOICES)}"
+
+TASK_COUNT_FIELDS = frozenset({'task_count', 'completed_tasks', 'completion_percentage'})
+
+
+class ProjectByIdLoader(RequestLoader):
+    """Projects by primary key, so foreign keys to the same project hit the DB once per request."""
+
+    def fetch(self, id):
+        return Project.objects.filter(pk=id).first()
 
 
 class ProjectType(DjangoObjectType):
@@ -19,6 +38,12 @@ class ProjectType(DjangoObjectType):
         fields = ("id", "name", "description", "status", "due_date", "created_at", "updated_at", "organization")
         description = "A project within an organization that contains tasks and tracks progress"
 
+    def resolve_organization(self, info):
+        """Use the joined organization if there is one, else the request's organization loader"""
+        if Project.organization.is_cached(self):
+            return self.organization
+        return get_loader(info, OrganizationByIdLoader).load(self.organization_id)
+
     def resolve_task_count(self, info):
         """Get total number of tasks in this project"""
         return self.task_count
@@ -32,6 +57,11 @@ class ProjectType(DjangoObjectType):
         return self.completion_percentage
 
 
+class ProjectFilter(graphene.InputObjectType):
+    """Filters for projectsByOrganization, validated by GraphQL before the resolver runs."""
+    organization_slug = graphene.String(required=True, description="Slug of the organization to retrieve projects from")
+
+
 class ProjectStatisticsType(graphene.ObjectType):
     """
     Detailed statistics for a project including task breakdown by status.
@@ -45,10 +75,29 @@ class ProjectStatisticsType(graphene.ObjectType):
     completion_percentage = graphene.Float(description="Percentage of completion (0-100)")
 
 
+def optimize_projects(queryset, info):
+    """
+    Shape a project queryset to the selection: only the requested columns, the
+    organization join when it's selected, and task counts as annotations.
+    """
+    requested = selected_fields(info)
+    if 'organization' in requested:
+        queryset = queryset.select_related('organization')
+    queryset = only_selected(queryset, info)
+    if requested & TASK_COUNT_FIELDS:
+        # Both counts come back in the same SELECT instead of two COUNTs per project
+        queryset = queryset.annotate(
+            task_count_ann=Count('tasks'),
+            completed_tasks_ann=Count('tasks', filter=Q(tasks__status='DONE'))
+        )
+    return queryset
+
+
 class Query(graphene.ObjectType):
     projects_by_organization = graphene.List(
         ProjectType,
-        organization_slug=graphene.String(required=True, description="Slug of the organization to retrieve projects from"),
+        organization_slug=graphene.String(description="Slug of the organization to retrieve projects from (or use filter)"),
+        filter=ProjectFilter(description="Organization to filter projects by (instead of organizationSlug)"),
         description="Retrieve all projects for a specific organization"
     )
     project_detail = graphene.Field(
@@ -62,44 +111,44 @@ class Query(graphene.ObjectType):
         description="Get detailed task statistics for a project (total, completed, in progress, etc.)"
     )
 
-    def resolve_projects_by_organization(self, info, organization_slug):
-        try:
-            organization = Organization.objects.get(slug=organization_slug)
-            return Project.objects.filter(organization=organization)
-        except Organization.DoesNotExist:
-            return []
+    def resolve_projects_by_organization(self, info, organization_slug=None, filter=None):
+        if (organization_slug is None) == (filter is None):
+            raise GraphQLError("Provide either organizationSlug or filter, not both")
+        if filter is not None:
+            organization_slug = filter.organization_slug
+
+        # One query: the slug filter joins organizations (and an unknown slug just matches nothing)
+        projects = Project.objects.filter(organization__slug=organization_slug)
+        return optimize_projects(projects, info)
 
     def resolve_project_detail(self, info, id):
-        try:
-            return Project.objects.select_related('organization').prefetch_related('tasks').get(pk=id)
-        except Project.DoesNotExist:
-            return None
+        return optimize_projects(Project.objects.filter(pk=id), info).first()
 
     def resolve_project_statistics(self, info, project_id):
-        try:
-            project = Project.objects.get(pk=project_id)
-            tasks = project.tasks.all()
-            
-            total_tasks = tasks.count()
-            completed_tasks = tasks.filter(status='DONE').count()
-            in_progress_tasks = tasks.filter(status='IN_PROGRESS').count()
-            todo_tasks = tasks.filter(status='TODO').count()
-            
-            completion_percentage = 0
-            if total_tasks > 0:
-                completion_percentage = round((completed_tasks / total_tasks) * 100, 1)
-            
-            return ProjectStatisticsType(
-                project_id=project_id,
-                total_tasks=total_tasks,
-                completed_tasks=completed_tasks,
-                in_progress_tasks=in_progress_tasks,
-                todo_tasks=todo_tasks,
-                completion_percentage=completion_percentage
-            )
-        except Project.DoesNotExist:
+        if not Project.objects.filter(pk=project_id).exists():
             return None
 
+        # One GROUP BY status pass; order_by() keeps Task's default ordering out of the grouping
+        counts = dict(
+            Task.objects.filter(project_id=project_id).order_by()
+            .values_list('status').annotate(n=Count('id'))
+        )
+        total_tasks = sum(counts.values())
+        completed_tasks = counts.get('DONE', 0)
+
+        completion_percentage = 0
+        if total_tasks > 0:
+            completion_percentage = round((completed_tasks / total_tasks) * 100, 1)
+
+        return ProjectStatisticsType(
+            project_id=project_id,
+            total_tasks=total_tasks,
+            completed_tasks=completed_tasks,
+            in_progress_tasks=counts.get('IN_PROGRESS', 0),
+            todo_tasks=counts.get('TODO', 0),
+            completion_percentage=completion_percentage
+        )
+
 
 class CreateProject(graphene.Mutation):
     """
@@ -119,19 +168,23 @@ class CreateProject(graphene.Mutation):
 
     def mutate(self, info, organization_id, name, description="", status="ACTIVE", due_date=None):
         try:
-            organization = Organization.objects.get(pk=organization_id)
-            
             # Validate status
-            valid_statuses = ['ACTIVE', 'COMPLETED', 'ON_HOLD']
-            if status not in valid_statuses:
+            if status not in _VALID_STATUSES:
+                return CreateProject(
+                    project=None,
+                    success=False,
+                    errors=[_INVALID_STATUS_ERROR]
+                )
+            
+            if not Organization.objects.filter(pk=organization_id).exists():
                 return CreateProject(
                     project=None,
                     success=False,
-                    errors=[f"Invalid status. Must be one of: {', '.join(valid_statuses)}"]
+                    errors=["Organization not found"]
                 )
             
             project = Project.objects.create(
-                organization=organization,
+                organization_id=organization_id,
                 name=name,
                 description=description,
                 status=status,
@@ -143,12 +196,6 @@ class CreateProject(graphene.Mutation):
                 success=True,
                 errors=[]
             )
-        except Organization.DoesNotExist:
-            return CreateProject(
-                project=None,
-                success=False,
-                errors=["Organization not found"]
-            )
         except Exception as e:
             return CreateProject(
                 project=None,
@@ -175,40 +222,117 @@ class UpdateProject(graphene.Mutation):
 
     def mutate(self, info, id, name=None, description=None, status=None, due_date=None):
         try:
-            project = Project.objects.get(pk=id)
+            if status is not None and status not in _VALID_STATUSES:
+                return UpdateProject(
+                    project=None,
+                    success=False,
+                    errors=[_INVALID_STATUS_ERROR]
+                )
+            
+            changes = {
+                field: value
+                for field, value in (('name', name), ('description', description), ('status', status), ('due_date', due_date))
+                if value is not None
+            }
+            
+            if not client_wants(info, 'project'):
+                # Nothing to send back, so skip loading the row: a single UPDATE (or EXISTS) will do
+                projects = Project.objects.filter(pk=id)
+                found = projects.update(**changes, updated_at=timezone.now()) if changes else projects.exists()
+                if not found:
+                    return UpdateProject(
+                        project=None,
+                        success=False,
+                        errors=["Project not found"]
+                    )
+                return UpdateProject(project=None, success=True, errors=[])
             
-            if name is not None:
-                project.name = name
-            if description is not None:
-                project.description = description
-            if status is not None:
-                valid_statuses = ['ACTIVE', 'COMPLETED', 'ON_HOLD']
-                if status not in valid_statuses:
+            # Lock the row so a concurrent update can't land between the read and the save
+            with transaction.atomic():
+                project = Project.objects.select_for_update().filter(pk=id).first()
+                if project is None:
                     return UpdateProject(
                         project=None,
                         success=False,
-                        errors=[f"Invalid status. Must be one of: {', '.join(valid_statuses)}"]
+                        errors=["Project not found"]
                     )
-                project.status = status
-            if due_date is not None:
-                project.due_date = due_date
-                
-            project.save()
+                for field, value in changes.items():
+                    setattr(project, field, value)
+                if changes:
+                    project.save(update_fields=[*changes, 'updated_at'])
             
             return UpdateProject(
                 project=project,
                 success=True,
                 errors=[]
             )
-        except Project.DoesNotExist:
+        except Exception as e:
             return UpdateProject(
                 project=None,
                 success=False,
-                errors=["Project not found"]
+                errors=[str(e)]
             )
+
+
+class BulkCreateProjectsInput(graphene.InputObjectType):
+    """One project to create in a bulkCreateProjects call."""
+    organization_id = graphene.ID(required=True, description="ID of the organization to create the project in")
+    name = graphene.String(required=True, description="Name of the project")
+    description = graphene.String(description="Detailed description of the project")
+    status = graphene.String(description="Project status: ACTIVE, COMPLETED, or ON_HOLD (default: ACTIVE)")
+    due_date = graphene.Date(description="Due date for project completion")
+
+
+class BulkCreateProjects(graphene.Mutation):
+    """
+    Creates many projects in one request with a single batched INSERT.
+    Every entry is validated first; if any entry is invalid, nothing is created.
+    """
+    class Arguments:
+        projects = graphene.List(
+            graphene.NonNull(BulkCreateProjectsInput),
+            required=True,
+            description="Projects to create"
+        )
+
+    projects = graphene.List(ProjectType, description="The created project objects, in input order")
+    success = graphene.Boolean(description="Whether the projects were created successfully")
+    errors = graphene.List(graphene.String, description="List of error messages if creation failed")
+
+    def mutate(self, info, projects):
+        try:
+            errors = [
+                f"projects[{index}]: {_INVALID_STATUS_ERROR}"
+                for index, entry in enumerate(projects)
+                if (entry.get('status') or 'ACTIVE') not in _VALID_STATUSES
+            ]
+
+            organization_ids = {str(entry['organization_id']) for entry in projects}
+            existing_ids = {
+                str(pk) for pk in Organization.objects.filter(pk__in=organization_ids).values_list('pk', flat=True)
+            }
+            errors.extend(
+                f"Organization not found: {organization_id}"
+                for organization_id in sorted(organization_ids - existing_ids)
+            )
+            if errors:
+                return BulkCreateProjects(projects=None, success=False, errors=errors)
+
+            created = Project.objects.bulk_create([
+                Project(
+                    organization_id=entry['organization_id'],
+                    name=entry['name'],
+                    description=entry.get('description') or "",
+                    status=entry.get('status') or 'ACTIVE',
+                    due_date=entry.get('due_date')
+                )
+                for entry in projects
+            ], batch_size=500)
+
+            return BulkCreateProjects(projects=created, success=True, errors=[])
         except Exception as e:
-            return UpdateProject(
-                project=None,
+            return BulkCreateProjects(
+                projects=None,
                 success=False,
                 errors=[str(e)]
             )
@@ -220,4 +344,5 @@ class Mutation(graphene.ObjectType):
     All mutations follow the same pattern with success/errors fields for consistent error handling.
     """
     create_project = CreateProject.Field(description="Create a new project in an organization")
-    update_project = UpdateProject.Field(description="Update project details (name, description, status, due date)")
\ No newline at end of file
+    update_project = UpdateProject.Field(description="Update project details (name, description, status, due date)")
+    bulk_create_projects = BulkCreateProjects.Field(description="Create many projects at once with a single batched insert")
\ No newline at end of file
@@ -2,25 +2,39 @@
 Tests for projects app models and functionality.
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.core.exceptions import ValidationError
+from django.db.models import Count, Q
 from django.utils import timezone
 from datetime import date, timedelta
-from organizations.models import Organization
 from projects.models import Project
+from tasks.models import Task
+from tests.factories import create_organization
+
+
+class ProjectValidationTest(SimpleTestCase):
+    """Validation checks on unsaved projects (no database access)."""
+
+    def test_invalid_status_choice(self):
+        """Test that invalid status choices are rejected."""
+        project = Project(name='Test Project', status='INVALID_STATUS')
+        
+        # The organization is left unset; its foreign key check would need the database
+        with self.assertRaises(ValidationError) as cm:
+            project.full_clean(exclude=['organization'])
+        self.assertIn('status', cm.exception.message_dict)
 
 
 class ProjectModelTest(TestCase):
     """Test cases for Project model."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.organization = create_organization()
+
     def setUp(self):
-        """Set up test data."""
-        self.organization = Organization.objects.create(
-            name='Test Organization',
-            slug='test-org',
-            contact_email='contact@testorg.com'
-        )
-        
+        """Set up per-test data."""
         self.project_data = {
             'organization': self.organization,
             'name': 'Test Project',
@@ -49,21 +63,12 @@ class ProjectModelTest(TestCase):
         """Test project status field choices."""
         valid_statuses = ['ACTIVE', 'COMPLETED', 'ON_HOLD']
         
-        for status in valid_statuses:
-            project_data = self.project_data.copy()
-            project_data['status'] = status
-            project = Project.objects.create(**project_data)
-            self.assertEqual(project.status, status)
-            project.delete()  # Clean up
-
-    def test_invalid_status_choice(self):
-        """Test that invalid status choices are rejected."""
-        project_data = self.project_data.copy()
-        project_data['status'] = 'INVALID_STATUS'
+        Project.objects.bulk_create([
+            Project(**{**self.project_data, 'status': status}) for status in valid_statuses
+        ])
         
-        project = Project(**project_data)
-        with self.assertRaises(ValidationError):
-            project.full_clean()
+        saved_statuses = Project.objects.filter(name='Test Project').values_list('status', flat=True)
+        self.assertCountEqual(saved_statuses, valid_statuses)
 
     def test_organization_relationship(self):
         """Test the foreign key relationship to Organization."""
@@ -71,7 +76,7 @@ class ProjectModelTest(TestCase):
         
         # Test the relationship works both ways
         self.assertEqual(project.organization, self.organization)
-        self.assertIn(project, self.organization.projects.all())
+        self.assertTrue(self.organization.projects.filter(pk=project.pk).exists())
 
     def test_cascade_delete(self):
         """Test that deleting organization cascades to projects."""
@@ -116,6 +121,33 @@ class ProjectModelTest(TestCase):
         if hasattr(project, 'task_count'):
             self.assertEqual(project.task_count, 0)
 
+    def test_task_stats_computed_in_one_query(self):
+        """Test completion_percentage counts both totals in one aggregate, and annotations need none."""
+        project = Project.objects.create(**self.project_data)
+        Task.objects.create(project=project, title='Open', status='TODO')
+        Task.objects.create(project=project, title='Done', status='DONE')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(project.completion_percentage, 50.0)
+
+        annotated = Project.objects.annotate(
+            task_count_ann=Count('tasks'),
+            completed_tasks_ann=Count('tasks', filter=Q(tasks__status='DONE'))
+        ).get(pk=project.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(annotated.task_count, 2)
+            self.assertEqual(annotated.completed_tasks, 1)
+            self.assertEqual(annotated.completion_percentage, 50.0)
+
+    def test_task_stats_follow_new_tasks(self):
+        """Test the counts on an unannotated instance reflect tasks added after the first read."""
+        project = Project.objects.create(**self.project_data)
+        self.assertEqual(project.task_count, 0)
+
+        Task.objects.create(project=project, title='Done', status='DONE')
+        self.assertEqual(project.task_count, 1)
+        self.assertEqual(project.completion_percentage, 100.0)
+
     def test_long_project_name(self):
         """Test handling of long project names."""
         long_name = 'A' * 200  # 200 character name
@@ -136,17 +168,10 @@ class ProjectModelTest(TestCase):
 
     def test_multiple_projects_same_organization(self):
         """Test multiple projects can belong to the same organization."""
-        project1 = Project.objects.create(
-            organization=self.organization,
-            name='Project 1',
-            status='ACTIVE'
-        )
-        
-        project2 = Project.objects.create(
-            organization=self.organization,
-            name='Project 2', 
-            status='COMPLETED'
-        )
+        project1, project2 = Project.objects.bulk_create([
+            Project(organization=self.organization, name='Project 1', status='ACTIVE'),
+            Project(organization=self.organization, name='Project 2', status='COMPLETED'),
+        ])
         
         # Both projects should belong to the same organization
         org_projects = self.organization.projects.all()
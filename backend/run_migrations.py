@@ -15,16 +15,16 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project_management.settings')
 # Setup Django
 django.setup()
 
-# Now run the migrations
-from django.core.management import execute_from_command_line
+# Now run the migrations in this process, reusing the app registry loaded above
+from django.core.management import call_command
 
 print("Creating migrations for all apps...")
 try:
-    execute_from_command_line(['manage.py', 'makemigrations'])
+    call_command('makemigrations')
     print("Migrations created successfully!")
     
     print("\nRunning migrations...")
-    execute_from_command_line(['manage.py', 'migrate'])
+    call_command('migrate')
     print("All migrations completed successfully!")
 except Exception as e:
     print(f"Error: {e}")
@@ -1,12 +1,30 @@
 from django.contrib import admin
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Substr
+from django.forms.models import BaseInlineFormSet
+from django.utils import timezone
 from .models import Task, TaskComment
 
 
+class TaskCommentInlineFormSet(BaseInlineFormSet):
+    """Hands each comment its parent task, so the row labels don't look it up again."""
+    
+    def _construct_form(self, i, **kwargs):
+        form = super()._construct_form(i, **kwargs)
+        form.instance.task = self.instance
+        return form
+
+
 class TaskCommentInline(admin.TabularInline):
     model = TaskComment
+    formset = TaskCommentInlineFormSet
     extra = 0
     readonly_fields = ['timestamp']
     fields = ['content', 'author_email', 'timestamp']
+    
+    def get_queryset(self, request):
+        # Only the columns the inline shows (plus its foreign key to the task)
+        return super().get_queryset(request).only('task', *self.fields)
 
 
 @admin.register(Task)
@@ -16,6 +34,7 @@ class TaskAdmin(admin.ModelAdmin):
     search_fields = ['title', 'description', 'assignee_email', 'project__name']
     readonly_fields = ['created_at', 'updated_at', 'organization', 'is_overdue']
     ordering = ['-created_at']
+    list_per_page = 50
     inlines = [TaskCommentInline]
     
     fieldsets = (
@@ -34,6 +53,23 @@ class TaskAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+    
+    def get_queryset(self, request):
+        # Project and organization are shown on the change list and the change form,
+        # and the database works out is_overdue against a single timestamp
+        return super().get_queryset(request).select_related('project__organization').annotate(
+            _is_overdue=ExpressionWrapper(
+                Q(due_date__isnull=False, due_date__lt=timezone.now()) & ~Q(status='DONE'),
+                output_field=BooleanField()
+            )
+        )
+    
+    def is_overdue(self, obj):
+        overdue = getattr(obj, '_is_overdue', None)
+        return overdue if overdue is not None else obj.is_overdue
+    is_overdue.boolean = True
+    is_overdue.admin_order_field = '_is_overdue'
+    is_overdue.short_description = 'Is overdue'
 
 
 @admin.register(TaskComment)
@@ -43,7 +79,20 @@ class TaskCommentAdmin(admin.ModelAdmin):
     search_fields = ['content', 'author_email', 'task__title']
     readonly_fields = ['timestamp', 'organization']
     ordering = ['-timestamp']
+    list_select_related = ['task__project']
+    
+    def get_queryset(self, request):
+        """On the change list, load a trimmed comment instead of the full text."""
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == f'{self.opts.app_label}_{self.opts.model_name}_changelist':
+            # One character past the preview length tells us whether to add '...'
+            queryset = queryset.defer('content').annotate(content_short=Substr('content', 1, 51))
+        return queryset
     
     def content_preview(self, obj):
-        return obj.content[:50] + '...' if len(obj.content) > 50 else obj.content
+        content = getattr(obj, 'content_short', None)
+        if content is None:
+            content = obj.content
+        return content[:50] + ('...' if len(content) > 50 else '')
     content_preview.short_description = 'Content Preview'
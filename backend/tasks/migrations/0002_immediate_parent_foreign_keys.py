@@ -0,0 +1,48 @@
+# Generated manually to check task/comment parent foreign keys per statement
+
+from django.db import migrations
+
+# (table, column) of the foreign keys that createTask / addTaskComment rely on
+FOREIGN_KEYS = [
+    ('tasks_task', 'project_id'),
+    ('tasks_taskcomment', 'task_id'),
+]
+
+
+def _set_foreign_keys(schema_editor, timing):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for table, column in FOREIGN_KEYS:
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = 'f' "
+                "AND pg_get_constraintdef(oid) LIKE %s",
+                [table, f'FOREIGN KEY ({column})%']
+            )
+            for (name,) in cursor.fetchall():
+                cursor.execute(f'ALTER TABLE "{table}" ALTER CONSTRAINT "{name}" DEFERRABLE INITIALLY {timing}')
+
+
+def make_immediate(apps, schema_editor):
+    """
+    Django creates foreign keys DEFERRABLE INITIALLY DEFERRED, so a missing
+    parent only fails at COMMIT. Checking these two at INSERT lets the
+    mutations skip their existence SELECT and map the IntegrityError instead.
+    They stay DEFERRABLE, so a transaction can still SET CONSTRAINTS ... DEFERRED.
+    """
+    _set_foreign_keys(schema_editor, 'IMMEDIATE')
+
+
+def make_deferred(apps, schema_editor):
+    _set_foreign_keys(schema_editor, 'DEFERRED')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(make_immediate, make_deferred),
+    ]
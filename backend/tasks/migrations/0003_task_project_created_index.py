@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-15 11:02
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('tasks', '0002_immediate_parent_foreign_keys'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='task',
+            index=models.Index(fields=['project', '-created_at'], name='task_proj_created_idx'),
+        ),
+    ]
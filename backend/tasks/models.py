@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from projects.models import Project
 
 
@@ -9,6 +10,9 @@ class Task(models.Model):
         ('DONE', 'Done'),
     ]
 
+    # Checked at INSERT (tasks 0002) so createTask can map the violation to
+    # "Project not found"; altering this field recreates the constraint
+    # INITIALLY DEFERRED, so a migration that does must re-run make_immediate.
     project = models.ForeignKey(
         Project,
         on_delete=models.CASCADE,
@@ -34,6 +38,7 @@ class Task(models.Model):
             models.Index(fields=['project', 'status']),
             models.Index(fields=['assignee_email']),
             models.Index(fields=['due_date']),
+            models.Index(fields=['project', '-created_at'], name='task_proj_created_idx'),
         ]
 
     def __str__(self):
@@ -45,13 +50,30 @@ class Task(models.Model):
 
     @property
     def is_overdue(self):
+        return self.is_overdue_at(timezone.now())
+
+    def is_overdue_at(self, now):
+        """Whether the task is past due at ``now`` and not done."""
         if not self.due_date:
             return False
-        from django.utils import timezone
-        return self.due_date < timezone.now() and self.status != 'DONE'
+        return self.due_date < now and self.status != 'DONE'
+
+
+class TaskCommentQuerySet(models.QuerySet):
+    def bulk_create_comments(self, task, items, batch_size=1000):
+        """
+        Insert many comments on ``task`` with batched multi-row INSERTs.
+        ``items`` are (content, author_email) pairs. Like any bulk_create this
+        skips save() and post_save, so no comment notifications are sent.
+        """
+        return self.bulk_create(
+            [TaskComment(task=task, content=content, author_email=author_email) for content, author_email in items],
+            batch_size=batch_size
+        )
 
 
 class TaskComment(models.Model):
+    # Checked at INSERT like Task.project (tasks 0002), for addTaskComment
     task = models.ForeignKey(
         Task,
         on_delete=models.CASCADE,
@@ -61,6 +83,8 @@ class TaskComment(models.Model):
     author_email = models.EmailField()
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    objects = TaskCommentQuerySet.as_manager()
+
     class Meta:
         ordering = ['-timestamp']
         verbose_name = 'Task Comment'
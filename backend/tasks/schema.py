@@ -1,8 +1,26 @@
+from functools import partial
+
 import graphene
 from graphene_django import DjangoObjectType
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from .models import Task, TaskComment
-from projects.models import Project
+from integrations.signals import TaskChanges, dispatch_task_changes
+from projects.schema import ProjectByIdLoader
+from project_management.loaders import get_loader, request_memo
+from project_management.selection import client_wants, only_selected, selection_tree
+
+_VALID_STATUSES = frozenset(status for status, _ in Task.TASK_STATUS_CHOICES)
+_INVALID_STATUS_ERROR = f"Invalid status. Must be one of: {', '.join(status for status, _ in Task.TASK_STATUS_CHOICES)}"
+
+
+def _task_pk(value):
+    """A task ID argument as a primary key value, or None if it can't be one."""
+    try:
+        return Task._meta.pk.to_python(value)
+    except ValidationError:
+        return None
 
 
 class TaskCommentType(DjangoObjectType):
@@ -29,15 +47,43 @@ class TaskType(DjangoObjectType):
         fields = ("id", "title", "description", "status", "assignee_email", "due_date", "created_at", "updated_at", "project")
         description = "A task within a project that can be tracked through different status states"
 
+    def resolve_project(self, info):
+        """Use the joined project if there is one, else the request's project loader"""
+        if Task.project.is_cached(self):
+            return self.project
+        return get_loader(info, ProjectByIdLoader).load(self.project_id)
+
     def resolve_is_overdue(self, info):
         """Calculate if task is overdue based on due date and completion status"""
-        return self.is_overdue
+        # One timestamp per request, so every task in a list is compared to the same instant
+        memo = request_memo(info)
+        if 'now' not in memo:
+            memo['now'] = timezone.now()
+        return self.is_overdue_at(memo['now'])
 
     def resolve_comments(self, info):
         """Retrieve all comments for this task with optimized database query"""
         return self.comments.all()
 
 
+def optimize_tasks(queryset, info):
+    """
+    Shape a task queryset to the selection: only the requested columns, the
+    project (and organization) join when selected, and comments prefetched
+    only when selected.
+    """
+    tree = selection_tree(info)
+    if 'project' in tree:
+        queryset = queryset.select_related(
+            'project__organization' if 'organization' in tree['project'] else 'project'
+        )
+    if 'comments' in tree:
+        queryset = queryset.prefetch_related('comments')
+    # isOverdue is computed from these columns
+    always = ('due_date', 'status') if 'is_overdue' in tree else ()
+    return only_selected(queryset, info, *always)
+
+
 class Query(graphene.ObjectType):
     tasks_by_project = graphene.List(
         TaskType,
@@ -51,17 +97,11 @@ class Query(graphene.ObjectType):
     )
 
     def resolve_tasks_by_project(self, info, project_id):
-        try:
-            project = Project.objects.get(pk=project_id)
-            return Task.objects.filter(project=project).prefetch_related('comments')
-        except Project.DoesNotExist:
-            return []
+        # No project probe: an unknown project simply has no tasks
+        return optimize_tasks(Task.objects.filter(project_id=project_id), info)
 
     def resolve_task_detail(self, info, id):
-        try:
-            return Task.objects.select_related('project__organization').prefetch_related('comments').get(pk=id)
-        except Task.DoesNotExist:
-            return None
+        return optimize_tasks(Task.objects.filter(pk=id), info).first()
 
 
 class CreateTask(graphene.Mutation):
@@ -82,27 +122,27 @@ class CreateTask(graphene.Mutation):
 
     def mutate(self, info, project_id, title, description="", assignee_email="", due_date=None):
         try:
-            project = Project.objects.get(pk=project_id)
-            
-            task = Task.objects.create(
-                project=project,
-                title=title,
-                description=description,
-                assignee_email=assignee_email,
-                due_date=due_date,
-                status='TODO'  # Default status
-            )
+            # No existence SELECT: the project_id foreign key is checked by the INSERT itself
+            with transaction.atomic():
+                task = Task.objects.create(
+                    project_id=project_id,
+                    title=title,
+                    description=description,
+                    assignee_email=assignee_email,
+                    due_date=due_date,
+                    status='TODO'  # Default status
+                )
             
             return CreateTask(
                 task=task,
                 success=True,
                 errors=[]
             )
-        except Project.DoesNotExist:
+        except IntegrityError as e:
             return CreateTask(
                 task=None,
                 success=False,
-                errors=["Project not found"]
+                errors=["Project not found" if 'project_id' in str(e) else str(e)]
             )
         except Exception as e:
             return CreateTask(
@@ -130,30 +170,41 @@ class UpdateTask(graphene.Mutation):
 
     def mutate(self, info, id, title=None, description=None, assignee_email=None, due_date=None):
         try:
-            task = Task.objects.get(pk=id)
+            changes = {
+                field: value
+                for field, value in (
+                    ('title', title), ('description', description),
+                    ('assignee_email', assignee_email), ('due_date', due_date)
+                )
+                if value is not None
+            }
             
-            if title is not None:
-                task.title = title
-            if description is not None:
-                task.description = description
-            if assignee_email is not None:
-                task.assignee_email = assignee_email
-            if due_date is not None:
-                task.due_date = due_date
-                
-            task.save()
+            if 'assignee_email' in changes:
+                # Reassignments go through save() so the integration signals see the old assignee
+                task = Task.objects.filter(pk=id).first()
+                found = task is not None
+                if found:
+                    for field, value in changes.items():
+                        setattr(task, field, value)
+                    task.save(update_fields=[*changes, 'updated_at'])
+            else:
+                # No integration watches these fields, so a single UPDATE replaces load-and-save
+                found = Task.objects.filter(pk=id).update(**changes, updated_at=timezone.now())
+                # and the row is only read back when the client selected it
+                task = Task.objects.filter(pk=id).first() if found and client_wants(info, 'task') else None
+            
+            if not found:
+                return UpdateTask(
+                    task=None,
+                    success=False,
+                    errors=["Task not found"]
+                )
             
             return UpdateTask(
                 task=task,
                 success=True,
                 errors=[]
             )
-        except Task.DoesNotExist:
-            return UpdateTask(
-                task=None,
-                success=False,
-                errors=["Task not found"]
-            )
         except Exception as e:
             return UpdateTask(
                 task=None,
@@ -177,19 +228,19 @@ class UpdateTaskStatus(graphene.Mutation):
 
     def mutate(self, info, id, status):
         try:
-            task = Task.objects.get(pk=id)
-            
-            # Validate status
-            valid_statuses = ['TODO', 'IN_PROGRESS', 'DONE']
-            if status not in valid_statuses:
+            # Validate status before touching the database
+            if status not in _VALID_STATUSES:
                 return UpdateTaskStatus(
                     task=None,
                     success=False,
-                    errors=[f"Invalid status. Must be one of: {', '.join(valid_statuses)}"]
+                    errors=[_INVALID_STATUS_ERROR]
                 )
             
+            # Loaded and saved (not a bare UPDATE) so the status-change and
+            # completion integrations fire from the save signals
+            task = Task.objects.get(pk=id)
             task.status = status
-            task.save()
+            task.save(update_fields=['status', 'updated_at'])
             
             return UpdateTaskStatus(
                 task=task,
@@ -210,6 +261,87 @@ class UpdateTaskStatus(graphene.Mutation):
             )
 
 
+class TaskStatusUpdateInput(graphene.InputObjectType):
+    """One status change in a batchUpdateTaskStatus call."""
+    id = graphene.ID(required=True, description="ID of the task to update")
+    status = graphene.String(required=True, description="New status: TODO, IN_PROGRESS, or DONE")
+
+
+class BatchUpdateTaskStatus(graphene.Mutation):
+    """
+    Updates the status of many tasks in one transaction, e.g. when several cards are moved on the board.
+    Every entry is validated first; if any entry is invalid or any task is missing, nothing is updated.
+    """
+    class Arguments:
+        updates = graphene.List(
+            graphene.NonNull(TaskStatusUpdateInput),
+            required=True,
+            description="Status changes to apply"
+        )
+
+    tasks = graphene.List(TaskType, description="The updated task objects, one per entry in input order")
+    success = graphene.Boolean(description="Whether the statuses were updated successfully")
+    errors = graphene.List(graphene.String, description="List of error messages if update failed")
+
+    def mutate(self, info, updates):
+        try:
+            errors = [
+                f"updates[{index}]: {_INVALID_STATUS_ERROR}"
+                for index, entry in enumerate(updates)
+                if entry['status'] not in _VALID_STATUSES
+            ]
+            if errors:
+                return BatchUpdateTaskStatus(tasks=None, success=False, errors=errors)
+
+            # Keyed by primary key, so "007" and "7" are the same task; later entries for a task win
+            pks = [_task_pk(entry['id']) for entry in updates]
+            statuses = dict(zip(pks, (entry['status'] for entry in updates)))
+
+            with transaction.atomic(savepoint=False):
+                # One locking SELECT for the whole batch, with the organization the integrations need
+                tasks = (
+                    Task.objects.select_related('project__organization')
+                    .select_for_update(of=('self',))
+                    .in_bulk([pk for pk in statuses if pk is not None])
+                )
+                missing = list(dict.fromkeys(
+                    str(entry['id']) for pk, entry in zip(pks, updates) if pk not in tasks
+                ))
+                if missing:
+                    return BatchUpdateTaskStatus(
+                        tasks=None,
+                        success=False,
+                        errors=[f"Task not found: {task_id}" for task_id in missing]
+                    )
+
+                # One UPDATE for the batch. bulk_update() sends no save signals, so
+                # the status-change and completion integrations are scheduled here,
+                # with the same TaskChanges the post_save handler would capture
+                now = timezone.now()
+                changed = []
+                for pk, status in statuses.items():
+                    task = tasks[pk]
+                    if task.status != status:
+                        organization = task.project.organization
+                        changed.append((task, TaskChanges(None, (task.status, status), organization.id, organization.slug)))
+                        task.status, task.updated_at = status, now
+                Task.objects.bulk_update([task for task, _ in changed], ['status', 'updated_at'])
+                for task, changes in changed:
+                    transaction.on_commit(partial(dispatch_task_changes, task, changes))
+
+            return BatchUpdateTaskStatus(
+                tasks=[tasks[pk] for pk in pks],
+                success=True,
+                errors=[]
+            )
+        except Exception as e:
+            return BatchUpdateTaskStatus(
+                tasks=None,
+                success=False,
+                errors=[str(e)]
+            )
+
+
 class AddTaskComment(graphene.Mutation):
     """
     Adds a comment to a task. Comments enable team collaboration and communication on specific tasks.
@@ -226,24 +358,24 @@ class AddTaskComment(graphene.Mutation):
 
     def mutate(self, info, task_id, content, author_email):
         try:
-            task = Task.objects.get(pk=task_id)
-            
-            comment = TaskComment.objects.create(
-                task=task,
-                content=content,
-                author_email=author_email
-            )
+            # No existence SELECT: the task_id foreign key is checked by the INSERT itself
+            with transaction.atomic():
+                comment = TaskComment.objects.create(
+                    task_id=task_id,
+                    content=content,
+                    author_email=author_email
+                )
             
             return AddTaskComment(
                 comment=comment,
                 success=True,
                 errors=[]
             )
-        except Task.DoesNotExist:
+        except IntegrityError as e:
             return AddTaskComment(
                 comment=None,
                 success=False,
-                errors=["Task not found"]
+                errors=["Task not found" if 'task_id' in str(e) else str(e)]
             )
         except Exception as e:
             return AddTaskComment(
@@ -261,4 +393,5 @@ class Mutation(graphene.ObjectType):
     create_task = CreateTask.Field(description="Create a new task in a project")
     update_task = UpdateTask.Field(description="Update task details (title, description, assignee, due date)")
     update_task_status = UpdateTaskStatus.Field(description="Update task status for drag-and-drop operations")
+    batch_update_task_status = BatchUpdateTaskStatus.Field(description="Update the status of several tasks in one transaction")
     add_task_comment = AddTaskComment.Field(description="Add a comment to a task for team collaboration")
\ No newline at end of file
@@ -2,32 +2,28 @@
 Tests for tasks app models and functionality.
 """
 
+from unittest import mock, skipUnless
+
+from django.db import IntegrityError, connection, transaction
 from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import datetime, timedelta
-from organizations.models import Organization
-from projects.models import Project
 from tasks.models import Task, TaskComment
+from tests.factories import create_organization, create_project, create_task
 
 
 class TaskModelTest(TestCase):
     """Test cases for Task model."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.organization = create_organization()
+        cls.project = create_project(cls.organization)
+
     def setUp(self):
-        """Set up test data."""
-        self.organization = Organization.objects.create(
-            name='Test Organization',
-            slug='test-org',
-            contact_email='contact@testorg.com'
-        )
-        
-        self.project = Project.objects.create(
-            organization=self.organization,
-            name='Test Project',
-            status='ACTIVE'
-        )
-        
+        """Set up per-test data."""
         self.task_data = {
             'project': self.project,
             'title': 'Test Task',
@@ -59,12 +55,16 @@ class TaskModelTest(TestCase):
         """Test task status field choices."""
         valid_statuses = ['TODO', 'IN_PROGRESS', 'DONE']
         
+        # All three in one INSERT, read back in one SELECT
+        Task.objects.bulk_create([
+            Task(**{**self.task_data, 'status': status, 'title': f'Task {status}'})  # Unique title
+            for status in valid_statuses
+        ])
+        saved = dict(Task.objects.filter(project=self.project).values_list('title', 'status'))
+        
         for status in valid_statuses:
-            task_data = self.task_data.copy()
-            task_data['status'] = status
-            task_data['title'] = f'Task {status}'  # Unique title
-            task = Task.objects.create(**task_data)
-            self.assertEqual(task.status, status)
+            with self.subTest(status=status):
+                self.assertEqual(saved[f'Task {status}'], status)
 
     def test_invalid_status_choice(self):
         """Test that invalid status choices are rejected."""
@@ -81,7 +81,7 @@ class TaskModelTest(TestCase):
         
         # Test the relationship works both ways
         self.assertEqual(task.project, self.project)
-        self.assertIn(task, self.project.tasks.all())
+        self.assertTrue(self.project.tasks.filter(pk=task.pk).exists())
 
     def test_organization_property(self):
         """Test the organization property."""
@@ -90,39 +90,25 @@ class TaskModelTest(TestCase):
 
     def test_is_overdue_property(self):
         """Test the is_overdue property."""
-        # Test task that is not overdue
-        future_task_data = self.task_data.copy()
-        future_task_data['due_date'] = timezone.now() + timedelta(days=1)
-        future_task_data['title'] = 'Future Task'
-        
-        future_task = Task.objects.create(**future_task_data)
-        self.assertFalse(future_task.is_overdue)
-        
-        # Test overdue task
-        past_task_data = self.task_data.copy() 
-        past_task_data['due_date'] = timezone.now() - timedelta(days=1)
-        past_task_data['title'] = 'Past Task'
-        past_task_data['status'] = 'TODO'
-        
-        past_task = Task.objects.create(**past_task_data)
-        self.assertTrue(past_task.is_overdue)
+        now = timezone.make_aware(datetime(2024, 1, 15, 12, 0))
+        # (title, due_date, status, expected is_overdue)
+        cases = [
+            ('Future Task', now + timedelta(days=1), 'TODO', False),
+            ('Past Task', now - timedelta(days=1), 'TODO', True),
+            ('Completed Past Task', now - timedelta(days=1), 'DONE', False),  # done tasks are never overdue
+            ('No Due Date Task', None, 'TODO', False),
+            ('Due Now Task', now, 'TODO', False),  # only overdue once the due date has passed
+        ]
         
-        # Test completed overdue task (should not be overdue)
-        completed_past_task_data = self.task_data.copy()
-        completed_past_task_data['due_date'] = timezone.now() - timedelta(days=1)
-        completed_past_task_data['title'] = 'Completed Past Task'
-        completed_past_task_data['status'] = 'DONE'
-        
-        completed_past_task = Task.objects.create(**completed_past_task_data)
-        self.assertFalse(completed_past_task.is_overdue)
-        
-        # Test task with no due date
-        no_due_date_task_data = self.task_data.copy()
-        no_due_date_task_data['due_date'] = None
-        no_due_date_task_data['title'] = 'No Due Date Task'
-        
-        no_due_date_task = Task.objects.create(**no_due_date_task_data)
-        self.assertFalse(no_due_date_task.is_overdue)
+        # One clock for the whole test, and one INSERT for every case
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            tasks = Task.objects.bulk_create([
+                Task(**{**self.task_data, 'title': title, 'due_date': due_date, 'status': status})
+                for title, due_date, status, _ in cases
+            ])
+            for task, (title, _, _, expected) in zip(tasks, cases):
+                with self.subTest(task=title):
+                    self.assertEqual(task.is_overdue, expected)
 
     def test_cascade_delete(self):
         """Test that deleting project cascades to tasks."""
@@ -163,26 +149,15 @@ class TaskModelTest(TestCase):
 class TaskCommentModelTest(TestCase):
     """Test cases for TaskComment model."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        cls.organization = create_organization()
+        cls.project = create_project(cls.organization)
+        cls.task = create_task(cls.project)
+
     def setUp(self):
-        """Set up test data."""
-        self.organization = Organization.objects.create(
-            name='Test Organization',
-            slug='test-org',
-            contact_email='contact@testorg.com'
-        )
-        
-        self.project = Project.objects.create(
-            organization=self.organization,
-            name='Test Project',
-            status='ACTIVE'
-        )
-        
-        self.task = Task.objects.create(
-            project=self.project,
-            title='Test Task',
-            status='TODO'
-        )
-        
+        """Set up per-test data."""
         self.comment_data = {
             'task': self.task,
             'content': 'This is a test comment',
@@ -210,7 +185,7 @@ class TaskCommentModelTest(TestCase):
         
         # Test the relationship works both ways
         self.assertEqual(comment.task, self.task)
-        self.assertIn(comment, self.task.comments.all())
+        self.assertTrue(self.task.comments.filter(pk=comment.pk).exists())
 
     def test_organization_property(self):
         """Test the organization property."""
@@ -268,20 +243,37 @@ class TaskCommentModelTest(TestCase):
 
     def test_multiple_comments_per_task(self):
         """Test multiple comments can belong to the same task."""
-        comment1 = TaskComment.objects.create(
-            task=self.task,
-            content='First comment',
-            author_email='user1@example.com'
-        )
-        
-        comment2 = TaskComment.objects.create(
-            task=self.task,
-            content='Second comment',
-            author_email='user2@example.com'
-        )
+        with self.assertNumQueries(1):
+            comment1, comment2 = TaskComment.objects.bulk_create_comments(self.task, [
+                ('First comment', 'user1@example.com'),
+                ('Second comment', 'user2@example.com'),
+            ])
         
         # Both comments should belong to the same task
         task_comments = self.task.comments.all()
-        self.assertIn(comment1, task_comments)
-        self.assertIn(comment2, task_comments)
+        self.assertEqual(task_comments.filter(pk__in=[comment1.pk, comment2.pk]).count(), 2)
         self.assertEqual(task_comments.count(), 2)
+
+
+@skipUnless(connection.vendor == 'postgresql', "the constraint timing is set by tasks 0002 on PostgreSQL only")
+class ParentForeignKeyTest(TestCase):
+    """Pin the constraint timing that createTask / addTaskComment rely on to report a missing parent."""
+
+    def test_parent_foreign_keys_checked_at_insert(self):
+        """Test the project/task foreign keys are DEFERRABLE INITIALLY IMMEDIATE, not Django's deferred default."""
+        with connection.cursor() as cursor:
+            for table, column in [('tasks_task', 'project_id'), ('tasks_taskcomment', 'task_id')]:
+                cursor.execute(
+                    "SELECT condeferrable, condeferred FROM pg_constraint WHERE conrelid = to_regclass(%s) "
+                    "AND contype = 'f' AND pg_get_constraintdef(oid) LIKE %s",
+                    [table, f'FOREIGN KEY ({column})%']
+                )
+                with self.subTest(table=table):
+                    self.assertEqual(cursor.fetchall(), [(True, False)])
+
+    def test_missing_parent_fails_at_insert(self):
+        """Test that the violation is raised by the INSERT itself, inside the caller's transaction."""
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Task.objects.create(project_id=999999, title='Orphan')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            TaskComment.objects.create(task_id=999999, content='Orphan', author_email='a@example.com')
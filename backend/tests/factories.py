@@ -0,0 +1,41 @@
+"""
+Shared test fixtures: the organization -> project -> task rows most test classes start from.
+
+Plain functions rather than factory_boy factories (not a dependency); keyword
+arguments override the defaults. Call them from setUpTestData so the rows are
+created once per class.
+"""
+
+from organizations.models import Organization
+from projects.models import Project
+from tasks.models import Task
+
+
+def create_organization(**overrides):
+    """An organization (default: 'Test Organization' / 'test-org')."""
+    return Organization.objects.create(**{
+        'name': 'Test Organization',
+        'slug': 'test-org',
+        'contact_email': 'contact@testorg.com',
+        **overrides,
+    })
+
+
+def create_project(organization=None, **overrides):
+    """An ACTIVE 'Test Project', in a new default organization unless one is given."""
+    return Project.objects.create(**{
+        'organization': organization or create_organization(),
+        'name': 'Test Project',
+        'status': 'ACTIVE',
+        **overrides,
+    })
+
+
+def create_task(project=None, **overrides):
+    """A TODO 'Test Task', in a new default project unless one is given."""
+    return Task.objects.create(**{
+        'project': project or create_project(),
+        'title': 'Test Task',
+        'status': 'TODO',
+        **overrides,
+    })
@@ -4,71 +4,96 @@ GraphQL API integration tests.
 Tests the complete GraphQL API including queries, mutations, and organization isolation.
 """
 
-from django.test import TestCase
+from unittest import mock, skipUnless
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
 from graphene.test import Client
+from project_management.query_cache import parse_and_validate
 from project_management.schema import schema
+from integrations.models import IntegrationLog
 from organizations.models import Organization
 from projects.models import Project
 from tasks.models import Task, TaskComment
 
+# Shared by the tests that move a task; the schema reuses its parsed document
+UPDATE_TASK_STATUS_MUTATION = '''
+mutation($id: ID!, $status: String!) {
+    updateTaskStatus(id: $id, status: $status) {
+        success
+        errors
+        task {
+            id
+            status
+        }
+    }
+}
+'''
+
 
 class GraphQLAPITest(TestCase):
     """Test GraphQL API queries and mutations."""
 
-    def setUp(self):
-        """Set up test data."""
-        # Create test organizations
-        self.org1 = Organization.objects.create(
-            name='Organization 1',
-            slug='org-1',
-            contact_email='contact@org1.com'
-        )
-        
-        self.org2 = Organization.objects.create(
-            name='Organization 2',
-            slug='org-2',
-            contact_email='contact@org2.com'
-        )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up data shared by every test in the class."""
+        # One INSERT per model rather than one per row
+        cls.org1, cls.org2 = Organization.objects.bulk_create([
+            Organization(
+                name='Organization 1',
+                slug='org-1',
+                contact_email='contact@org1.com'
+            ),
+            Organization(
+                name='Organization 2',
+                slug='org-2',
+                contact_email='contact@org2.com'
+            ),
+        ])
         
         # Create test projects
-        self.project1 = Project.objects.create(
-            organization=self.org1,
-            name='Project 1',
-            description='First project',
-            status='ACTIVE'
-        )
-        
-        self.project2 = Project.objects.create(
-            organization=self.org2,
-            name='Project 2', 
-            description='Second project',
-            status='ACTIVE'
-        )
+        cls.project1, cls.project2 = Project.objects.bulk_create([
+            Project(
+                organization=cls.org1,
+                name='Project 1',
+                description='First project',
+                status='ACTIVE'
+            ),
+            Project(
+                organization=cls.org2,
+                name='Project 2', 
+                description='Second project',
+                status='ACTIVE'
+            ),
+        ])
         
         # Create test tasks
-        self.task1 = Task.objects.create(
-            project=self.project1,
-            title='Task 1',
-            description='First task',
-            status='TODO',
-            assignee_email='user1@example.com'
-        )
-        
-        self.task2 = Task.objects.create(
-            project=self.project1,
-            title='Task 2',
-            description='Second task',
-            status='IN_PROGRESS'
-        )
+        cls.task1, cls.task2 = Task.objects.bulk_create([
+            Task(
+                project=cls.project1,
+                title='Task 1',
+                description='First task',
+                status='TODO',
+                assignee_email='user1@example.com'
+            ),
+            Task(
+                project=cls.project1,
+                title='Task 2',
+                description='Second task',
+                status='IN_PROGRESS'
+            ),
+        ])
         
         # Create test comments
-        self.comment1 = TaskComment.objects.create(
-            task=self.task1,
+        cls.comment1 = TaskComment.objects.create(
+            task=cls.task1,
             content='First comment',
             author_email='commenter@example.com'
         )
-        
-        # Set up GraphQL client
+
+    def setUp(self):
+        """Set up the GraphQL client (kept per test: setUpTestData attributes are deep-copied for every test)."""
         self.client = Client(schema)
 
     def test_organization_list_query(self):
@@ -96,6 +121,53 @@ class GraphQLAPITest(TestCase):
         self.assertIn('Organization 1', org_names)
         self.assertIn('Organization 2', org_names)
 
+    def test_organizations_connection_query(self):
+        """Test the paginated organizations connection."""
+        query = '''
+        query {
+            organizations(first: 1) {
+                edges {
+                    node {
+                        name
+                        slug
+                    }
+                }
+                pageInfo {
+                    hasNextPage
+                }
+            }
+        }
+        '''
+        
+        result = self.client.execute(query)
+        
+        self.assertIsNone(result.get('errors'))
+        
+        connection = result['data']['organizations']
+        self.assertEqual([edge['node']['slug'] for edge in connection['edges']], ['org-1'])
+        self.assertTrue(connection['pageInfo']['hasNextPage'])
+
+    def test_organization_detail_and_projects_by_slug_query_count(self):
+        """Test organizationDetail and projectsByOrganization by slug take one query each."""
+        query = '''
+        query($slug: String!) {
+            organizationDetail(slug: $slug) {
+                name
+            }
+            projectsByOrganization(organizationSlug: $slug) {
+                name
+            }
+        }
+        '''
+        
+        # organization lookup + projects filtered on organization__slug (no separate organization lookup)
+        with self.assertNumQueries(2):
+            result = self.client.execute(query, variables={'slug': 'org-1'}, context_value={})
+        
+        self.assertIsNone(result.get('errors'))
+        self.assertEqual(result['data']['organizationDetail']['name'], 'Organization 1')
+        self.assertEqual(len(result['data']['projectsByOrganization']), 1)
+
     def test_projects_by_organization_query(self):
         """Test projectsByOrganization query."""
         query = '''
@@ -114,7 +186,9 @@ class GraphQLAPITest(TestCase):
         '''
         
         variables = {'organizationSlug': 'org-1'}
-        result = self.client.execute(query, variables=variables)
+        # The organization is joined into the projects query
+        with self.assertNumQueries(1):
+            result = self.client.execute(query, variables=variables)
         
         self.assertIsNone(result.get('errors'))
         
@@ -126,6 +200,118 @@ class GraphQLAPITest(TestCase):
         self.assertEqual(project['status'], 'ACTIVE')
         self.assertEqual(project['organization']['slug'], 'org-1')
 
+    def test_projects_by_organization_filter_input(self):
+        """Test projectsByOrganization with the ProjectFilter input, and that exactly one of the arguments is required."""
+        query = '''
+        query($slug: String, $filter: ProjectFilter) {
+            projectsByOrganization(organizationSlug: $slug, filter: $filter) {
+                name
+            }
+        }
+        '''
+        
+        result = self.client.execute(query, variables={'filter': {'organizationSlug': 'org-1'}})
+        self.assertIsNone(result.get('errors'))
+        self.assertEqual(result['data']['projectsByOrganization'], [{'name': 'Project 1'}])
+        
+        for variables in ({}, {'slug': 'org-2', 'filter': {'organizationSlug': 'org-1'}}):
+            with self.subTest(variables=variables):
+                result = self.client.execute(query, variables=variables)
+                self.assertEqual(
+                    [error['message'] for error in result['errors']],
+                    ["Provide either organizationSlug or filter, not both"]
+                )
+        
+        # The filter takes no status
+        result = self.client.execute('''
+        query {
+            projectsByOrganization(filter: {organizationSlug: "org-1", status: "ACTIVE"}) {
+                name
+            }
+        }
+        ''')
+        self.assertIsNotNone(result.get('errors'))
+
+    def test_projects_by_organization_task_counts_annotated(self):
+        """Test that task counts come from the projects query, not per-project COUNTs."""
+        Task.objects.create(project=self.project1, title='Task 3', status='DONE')
+        query = '''
+        query($organizationSlug: String!) {
+            projectsByOrganization(organizationSlug: $organizationSlug) {
+                taskCount
+                completedTasks
+                completionPercentage
+            }
+        }
+        '''
+
+        # projects joined to organizations by slug, with the counts annotated
+        with self.assertNumQueries(1):
+            result = self.client.execute(query, variables={'organizationSlug': 'org-1'})
+
+        self.assertIsNone(result.get('errors'))
+        project = result['data']['projectsByOrganization'][0]
+        self.assertEqual(project['taskCount'], 3)
+        self.assertEqual(project['completedTasks'], 1)
+        self.assertEqual(project['completionPercentage'], 33.3)
+
+    def test_project_detail_query_shaped_by_selection(self):
+        """Test projectDetail fetches the project, organization and counts in one query."""
+        query = '''
+        query($id: ID!) {
+            projectDetail(id: $id) {
+                ...ProjectFields
+                organization {
+                    slug
+                }
+            }
+        }
+        fragment ProjectFields on ProjectType {
+            name
+            taskCount
+        }
+        '''
+
+        with self.assertNumQueries(1):
+            result = self.client.execute(query, variables={'id': str(self.project1.id)})
+
+        self.assertIsNone(result.get('errors'))
+        self.assertEqual(result['data']['projectDetail'], {
+            'name': 'Project 1',
+            'taskCount': 2,
+            'organization': {'slug': 'org-1'},
+        })
+
+    def test_project_statistics_query(self):
+        """Test projectStatistics query aggregates all counts at once."""
+        query = '''
+        query($projectId: ID!) {
+            projectStatistics(projectId: $projectId) {
+                totalTasks
+                completedTasks
+                inProgressTasks
+                todoTasks
+                completionPercentage
+            }
+        }
+        '''
+
+        # existence check + aggregate
+        with self.assertNumQueries(2):
+            result = self.client.execute(query, variables={'projectId': str(self.project1.id)})
+
+        self.assertIsNone(result.get('errors'))
+        self.assertEqual(result['data']['projectStatistics'], {
+            'totalTasks': 2,
+            'completedTasks': 0,
+            'inProgressTasks': 1,
+            'todoTasks': 1,
+            'completionPercentage': 0.0,
+        })
+
+        result = self.client.execute(query, variables={'projectId': '99999'})
+        self.assertIsNone(result['data']['projectStatistics'])
+
     def test_tasks_by_project_query(self):
         """Test tasksByProject query."""
         query = '''
@@ -136,6 +322,7 @@ class GraphQLAPITest(TestCase):
                 description
                 status
                 assigneeEmail
+                isOverdue
                 project {
                     name
                 }
@@ -149,7 +336,9 @@ class GraphQLAPITest(TestCase):
         '''
         
         variables = {'projectId': str(self.project1.id)}
-        result = self.client.execute(query, variables=variables)
+        # Tasks with the project joined, plus one prefetch for every task's comments
+        with self.assertNumQueries(2):
+            result = self.client.execute(query, variables=variables)
         
         self.assertIsNone(result.get('errors'))
         
@@ -162,6 +351,49 @@ class GraphQLAPITest(TestCase):
         self.assertEqual(len(task_with_comments['comments']), 1)
         self.assertEqual(task_with_comments['comments'][0]['content'], 'First comment')
 
+    def test_tasks_by_project_foreign_keys_loaded_once(self):
+        """Test that tasks come back with their project and organization in one query."""
+        query = '''
+        query($projectId: ID!) {
+            tasksByProject(projectId: $projectId) {
+                title
+                project {
+                    name
+                    organization {
+                        slug
+                    }
+                }
+            }
+        }
+        '''
+
+        # tasks joined to project and organization (comments aren't selected, so no prefetch)
+        with self.assertNumQueries(1):
+            result = self.client.execute(
+                query, variables={'projectId': str(self.project1.id)}, context_value={}
+            )
+
+        self.assertIsNone(result.get('errors'))
+        for task in result['data']['tasksByProject']:
+            self.assertEqual(task['project'], {'name': 'Project 1', 'organization': {'slug': 'org-1'}})
+
+    def test_task_detail_query_shaped_by_selection(self):
+        """Test taskDetail skips joins and the comments prefetch the selection doesn't need."""
+        query = '''
+        query($id: ID!) {
+            taskDetail(id: $id) {
+                title
+                isOverdue
+            }
+        }
+        '''
+        
+        with self.assertNumQueries(1):
+            result = self.client.execute(query, variables={'id': str(self.task1.id)})
+        
+        self.assertIsNone(result.get('errors'))
+        self.assertEqual(result['data']['taskDetail'], {'title': 'Task 1', 'isOverdue': False})
+
     def test_task_detail_query(self):
         """Test taskDetail query."""
         query = '''
@@ -183,13 +415,18 @@ class GraphQLAPITest(TestCase):
                     content
                     authorEmail
                     timestamp
+                    task {
+                        title
+                    }
                 }
             }
         }
         '''
         
         variables = {'id': str(self.task1.id)}
-        result = self.client.execute(query, variables=variables)
+        # The task with project and organization joined, plus its comments (which point back at it)
+        with self.assertNumQueries(2):
+            result = self.client.execute(query, variables=variables)
         
         self.assertIsNone(result.get('errors'))
         
@@ -197,6 +434,7 @@ class GraphQLAPITest(TestCase):
         self.assertEqual(task['title'], 'Task 1')
         self.assertEqual(task['project']['name'], 'Project 1')
         self.assertEqual(task['project']['organization']['slug'], 'org-1')
+        self.assertEqual(task['comments'][0]['task'], {'title': 'Task 1'})
 
     def test_create_task_mutation(self):
         """Test createTask mutation."""
@@ -242,8 +480,49 @@ class GraphQLAPITest(TestCase):
         self.assertEqual(new_task['assigneeEmail'], 'newuser@example.com')
         
         # Verify task was actually created in database
-        db_task = Task.objects.get(id=new_task['id'])
-        self.assertEqual(db_task.title, 'New Test Task')
+        self.assertTrue(Task.objects.filter(id=new_task['id'], title='New Test Task').exists())
+
+    @skipUnless(connection.vendor == 'postgresql', "relies on the immediate foreign key from tasks 0002")
+    def test_create_task_mutation_unknown_project(self):
+        """Test createTask reports a missing project from the foreign key violation."""
+        mutation = '''
+        mutation($projectId: ID!, $title: String!) {
+            createTask(projectId: $projectId, title: $title) {
+                success
+                errors
+            }
+        }
+        '''
+        
+        result = self.client.execute(mutation, variables={'projectId': '99999', 'title': 'Orphan'})
+        
+        self.assertFalse(result['data']['createTask']['success'])
+        self.assertEqual(result['data']['createTask']['errors'], ["Project not found"])
+        self.assertFalse(Task.objects.filter(title='Orphan').exists())
+
+    def test_update_task_mutation_without_reassignment_is_one_update(self):
+        """Test updateTask writes untracked fields with a single UPDATE."""
+        mutation = '''
+        mutation($id: ID!, $title: String) {
+            updateTask(id: $id, title: $title) {
+                success
+                task {
+                    title
+                    assigneeEmail
+                }
+            }
+        }
+        '''
+        
+        # UPDATE + reading the task back for the payload
+        with self.assertNumQueries(2):
+            result = self.client.execute(mutation, variables={'id': str(self.task1.id), 'title': 'Renamed'})
+        
+        self.assertTrue(result['data']['updateTask']['success'])
+        self.assertEqual(result['data']['updateTask']['task'], {'title': 'Renamed', 'assigneeEmail': 'user1@example.com'})
+        
+        result = self.client.execute(mutation, variables={'id': '99999', 'title': 'Renamed'})
+        self.assertFalse(result['data']['updateTask']['success'])
 
     def test_update_task_mutation(self):
         """Test updateTask mutation."""
@@ -287,30 +566,124 @@ class GraphQLAPITest(TestCase):
         self.assertEqual(updated_task['assigneeEmail'], 'updated@example.com')
         
         # Verify task was actually updated in database
-        db_task = Task.objects.get(id=self.task1.id)
-        self.assertEqual(db_task.title, 'Updated Task Title')
+        self.task1.refresh_from_db(fields=['title'])
+        self.assertEqual(self.task1.title, 'Updated Task Title')
 
-    def test_update_task_status_mutation(self):
-        """Test updateTaskStatus mutation."""
+    def test_update_project_mutation_without_project_selection(self):
+        """Test updateProject skips loading the project when the client doesn't select it."""
         mutation = '''
-        mutation($id: ID!, $status: String!) {
-            updateTaskStatus(id: $id, status: $status) {
+        mutation($id: ID!, $status: String) {
+            updateProject(id: $id, status: $status) {
                 success
                 errors
-                task {
-                    id
+            }
+        }
+        '''
+        
+        with self.assertNumQueries(1):
+            result = self.client.execute(mutation, variables={'id': str(self.project1.id), 'status': 'ON_HOLD'})
+        
+        self.assertTrue(result['data']['updateProject']['success'])
+        self.assertEqual(Project.objects.get(pk=self.project1.pk).status, 'ON_HOLD')
+        
+        result = self.client.execute(mutation, variables={'id': '99999', 'status': 'ON_HOLD'})
+        self.assertFalse(result['data']['updateProject']['success'])
+        self.assertEqual(result['data']['updateProject']['errors'], ['Project not found'])
+
+    def test_bulk_create_projects_mutation(self):
+        """Test bulkCreateProjects creates every project in one batched insert."""
+        mutation = '''
+        mutation($projects: [BulkCreateProjectsInput!]!) {
+            bulkCreateProjects(projects: $projects) {
+                success
+                errors
+                projects {
+                    name
                     status
                 }
             }
         }
         '''
+        projects = [
+            {'organizationId': str(self.org1.id), 'name': 'Bulk A'},
+            {'organizationId': str(self.org2.id), 'name': 'Bulk B', 'status': 'ON_HOLD'},
+        ]
+        
+        # a single multi-row INSERT, whatever the number of projects
+        with CaptureQueriesContext(connection) as queries:
+            result = self.client.execute(mutation, variables={'projects': projects})
+        
+        self.assertIsNone(result.get('errors'))
+        bulk_result = result['data']['bulkCreateProjects']
+        self.assertTrue(bulk_result['success'])
+        self.assertEqual(bulk_result['projects'], [
+            {'name': 'Bulk A', 'status': 'ACTIVE'},
+            {'name': 'Bulk B', 'status': 'ON_HOLD'},
+        ])
+        inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 1)
+        
+        # An invalid entry rejects the whole batch
+        projects.append({'organizationId': '99999', 'name': 'Bulk C', 'status': 'ARCHIVED'})
+        result = self.client.execute(mutation, variables={'projects': projects})
+        bulk_result = result['data']['bulkCreateProjects']
+        self.assertFalse(bulk_result['success'])
+        self.assertEqual(len(bulk_result['errors']), 2)
+        self.assertFalse(Project.objects.filter(name='Bulk C').exists())
+        self.assertEqual(Project.objects.filter(name__startswith='Bulk').count(), 2)
+
+    def test_update_project_mutation_writes_only_changed_fields(self):
+        """Test updateProject only writes the fields it was given."""
+        mutation = '''
+        mutation($id: ID!, $name: String) {
+            updateProject(id: $id, name: $name) {
+                success
+                errors
+                project {
+                    name
+                    description
+                }
+            }
+        }
+        '''
+        
+        with CaptureQueriesContext(connection) as queries:
+            result = self.client.execute(mutation, variables={'id': str(self.project1.id), 'name': 'Renamed'})
+        
+        self.assertIsNone(result.get('errors'))
+        update_result = result['data']['updateProject']
+        self.assertTrue(update_result['success'])
+        self.assertEqual(update_result['project'], {'name': 'Renamed', 'description': 'First project'})
+        
+        update_sql = next(q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE'))
+        self.assertIn('"name"', update_sql)
+        self.assertNotIn('"description"', update_sql)
+
+    def test_update_task_mutation_without_task_selection(self):
+        """Test updateTask doesn't read the task back when the client doesn't select it."""
+        mutation = '''
+        mutation($id: ID!, $dueDate: DateTime) {
+            updateTask(id: $id, dueDate: $dueDate) {
+                success
+                errors
+            }
+        }
+        '''
+        
+        with self.assertNumQueries(1):
+            result = self.client.execute(mutation, variables={'id': str(self.task2.id), 'dueDate': '2030-01-01T00:00:00+00:00'})
         
+        self.assertTrue(result['data']['updateTask']['success'])
+        self.assertEqual(Task.objects.get(pk=self.task2.pk).due_date.year, 2030)
+
+    def test_update_task_status_mutation(self):
+        """Test updateTaskStatus mutation."""
         variables = {
             'id': str(self.task1.id),
             'status': 'DONE'
         }
         
-        result = self.client.execute(mutation, variables=variables)
+        result = self.client.execute(UPDATE_TASK_STATUS_MUTATION, variables=variables)
         
         self.assertIsNone(result.get('errors'))
         
@@ -321,8 +694,97 @@ class GraphQLAPITest(TestCase):
         self.assertEqual(updated_task['status'], 'DONE')
         
         # Verify status was actually updated in database
-        db_task = Task.objects.get(id=self.task1.id)
-        self.assertEqual(db_task.status, 'DONE')
+        self.task1.refresh_from_db(fields=['status'])
+        self.assertEqual(self.task1.status, 'DONE')
+
+    def test_batch_update_task_status_mutation(self):
+        """Test batchUpdateTaskStatus applies every change and still fires the status integrations."""
+        mutation = '''
+        mutation($updates: [TaskStatusUpdateInput!]!) {
+            batchUpdateTaskStatus(updates: $updates) {
+                success
+                errors
+                tasks {
+                    id
+                    status
+                }
+            }
+        }
+        '''
+        updates = [
+            {'id': str(self.task1.id), 'status': 'DONE'},
+            {'id': str(self.task2.id), 'status': 'TODO'},
+        ]
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            result = self.client.execute(mutation, variables={'updates': updates})
+        
+        self.assertIsNone(result.get('errors'))
+        batch_result = result['data']['batchUpdateTaskStatus']
+        self.assertTrue(batch_result['success'])
+        self.assertEqual(batch_result['tasks'], [
+            {'id': str(self.task1.id), 'status': 'DONE'},
+            {'id': str(self.task2.id), 'status': 'TODO'},
+        ])
+        self.assertEqual(
+            dict(Task.objects.filter(project=self.project1).values_list('title', 'status')),
+            {'Task 1': 'DONE', 'Task 2': 'TODO'}
+        )
+        self.assertTrue(IntegrationLog.objects.filter(
+            task=self.task1, event_type=IntegrationLog.EventType.TASK_COMPLETED
+        ).exists())
+        
+        # An unknown task or an invalid status rejects the whole batch
+        for bad_entry in ({'id': '99999', 'status': 'DONE'}, {'id': str(self.task2.id), 'status': 'ARCHIVED'}):
+            result = self.client.execute(mutation, variables={
+                'updates': [{'id': str(self.task1.id), 'status': 'IN_PROGRESS'}, bad_entry]
+            })
+            batch_result = result['data']['batchUpdateTaskStatus']
+            self.assertFalse(batch_result['success'])
+            self.assertEqual(len(batch_result['errors']), 1)
+            self.assertEqual(Task.objects.get(pk=self.task1.pk).status, 'DONE')
+
+    def test_batch_update_task_status_is_one_update(self):
+        """Test batchUpdateTaskStatus locks and updates the batch in two statements, integrations after commit."""
+        mutation = '''
+        mutation($updates: [TaskStatusUpdateInput!]!) {
+            batchUpdateTaskStatus(updates: $updates) {
+                success
+                tasks {
+                    id
+                    status
+                }
+            }
+        }
+        '''
+        updates = [
+            {'id': f'00{self.task1.id}', 'status': 'IN_PROGRESS'},  # zero-padded ids name the same task
+            {'id': str(self.task2.id), 'status': 'DONE'},
+            {'id': str(self.task1.id), 'status': 'DONE'},  # later entries for a task win
+        ]
+
+        # The locking SELECT and one UPDATE; nothing is sent or logged before commit
+        with self.assertNumQueries(2), self.captureOnCommitCallbacks() as callbacks:
+            result = self.client.execute(mutation, variables={'updates': updates})
+
+        batch_result = result['data']['batchUpdateTaskStatus']
+        self.assertTrue(batch_result['success'])
+        # One task per entry, in input order
+        self.assertEqual(batch_result['tasks'], [
+            {'id': str(self.task1.id), 'status': 'DONE'},
+            {'id': str(self.task2.id), 'status': 'DONE'},
+            {'id': str(self.task1.id), 'status': 'DONE'},
+        ])
+        self.assertEqual(len(callbacks), 2)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            sorted(IntegrationLog.objects.filter(
+                event_type=IntegrationLog.EventType.TASK_COMPLETED
+            ).values_list('task_id', flat=True)),
+            sorted([self.task1.id, self.task2.id])
+        )
 
     def test_add_task_comment_mutation(self):
         """Test addTaskComment mutation."""
@@ -366,8 +828,25 @@ class GraphQLAPITest(TestCase):
         self.assertEqual(new_comment['task']['title'], 'Task 2')
         
         # Verify comment was actually created in database
-        db_comment = TaskComment.objects.get(id=new_comment['id'])
-        self.assertEqual(db_comment.content, 'New test comment')
+        self.assertTrue(TaskComment.objects.filter(id=new_comment['id'], content='New test comment').exists())
+
+    @skipUnless(connection.vendor == 'postgresql', "relies on the immediate foreign key from tasks 0002")
+    def test_add_task_comment_mutation_unknown_task(self):
+        """Test addTaskComment reports a missing task from the foreign key violation."""
+        mutation = '''
+        mutation($taskId: ID!) {
+            addTaskComment(taskId: $taskId, content: "Orphan", authorEmail: "a@example.com") {
+                success
+                errors
+            }
+        }
+        '''
+
+        result = self.client.execute(mutation, variables={'taskId': '99999'})
+
+        self.assertFalse(result['data']['addTaskComment']['success'])
+        self.assertEqual(result['data']['addTaskComment']['errors'], ["Task not found"])
+        self.assertFalse(TaskComment.objects.filter(content='Orphan').exists())
 
     def test_organization_isolation(self):
         """Test that organization data is properly isolated."""
@@ -401,33 +880,61 @@ class GraphQLAPITest(TestCase):
         self.assertEqual(projects[0]['name'], 'Project 2')
         self.assertEqual(projects[0]['organization']['slug'], 'org-2')
 
-    def test_invalid_task_status_mutation(self):
-        """Test updateTaskStatus with invalid status."""
-        mutation = '''
-        mutation($id: ID!, $status: String!) {
-            updateTaskStatus(id: $id, status: $status) {
-                success
-                errors
-                task {
-                    id
-                    status
-                }
+    def test_repeated_query_reuses_parsed_document(self):
+        """Test that executing the same query text again skips parse and validation."""
+        query = '''
+        query($organizationSlug: String!) {
+            projectsByOrganization(organizationSlug: $organizationSlug) {
+                name
             }
         }
         '''
         
+        self.client.execute(query, variables={'organizationSlug': 'org-1'})
+        hits = parse_and_validate.cache_info().hits
+        result = self.client.execute(query, variables={'organizationSlug': 'org-2'})
+        
+        self.assertEqual(parse_and_validate.cache_info().hits, hits + 1)
+        self.assertIsNone(result.get('errors'))
+        self.assertEqual(result['data']['projectsByOrganization'], [{'name': 'Project 2'}])
+        
+        # Invalid queries still report their errors from the cache
+        for _ in range(2):
+            result = self.client.execute('query { projectsByOrganization { name } }')
+            self.assertIsNotNone(result.get('errors'))
+
+
+class GraphQLValidationTest(SimpleTestCase):
+    """Test mutations that reject their input before touching the database (any query fails the test)."""
+
+    def setUp(self):
+        """Set up the GraphQL client."""
+        self.client = Client(schema)
+
+    def test_invalid_task_status_mutation(self):
+        """Test updateTaskStatus with invalid status."""
         variables = {
-            'id': str(self.task1.id),
+            'id': '1',
             'status': 'INVALID_STATUS'
         }
         
-        result = self.client.execute(mutation, variables=variables)
+        result = self.client.execute(UPDATE_TASK_STATUS_MUTATION, variables=variables)
         
         self.assertIsNone(result.get('errors'))
         
         update_result = result['data']['updateTaskStatus']
         self.assertFalse(update_result['success'])
-        self.assertTrue(len(update_result['errors']) > 0)
+        # The validation message, not a swallowed "database queries are not allowed" error
+        self.assertEqual(len(update_result['errors']), 1)
+        self.assertTrue(update_result['errors'][0].startswith('Invalid status'))
+
+
+class GraphQLEmptyResultTest(TestCase):
+    """Test queries for rows that don't exist, against an empty database (no shared fixtures)."""
+
+    def setUp(self):
+        """Set up the GraphQL client."""
+        self.client = Client(schema)
 
     def test_nonexistent_task_query(self):
         """Test querying non-existent task."""
@@ -485,4 +992,45 @@ class GraphQLAPITest(TestCase):
         result = self.client.execute(query, variables=variables)
         
         self.assertIsNone(result.get('errors'))
-        self.assertEqual(result['data']['projectsByOrganization'], [])
\ No newline at end of file
+        self.assertEqual(result['data']['projectsByOrganization'], [])
+
+
+class GraphQLViewTest(TestCase):
+    """Test the /graphql/ endpoint itself, through Django's test client."""
+
+    def post_query(self, query, variables=None):
+        return self.client.post(
+            '/graphql/', {'query': query, 'variables': variables or {}}, content_type='application/json'
+        )
+
+    def test_repeated_request_skips_parse(self):
+        """Test that the view takes a repeat query's document from the cache instead of parsing it."""
+        Organization.objects.create(name='View Org', slug='view-org', contact_email='view@example.com')
+        query = 'query($slug: String!) { organizationDetail(slug: $slug) { name } }'
+
+        self.post_query(query, {'slug': 'view-org'})
+        hits = parse_and_validate.cache_info().hits
+        with mock.patch('project_management.query_cache.parse') as parse, \
+                mock.patch('graphene_django.views.parse') as view_parse:
+            response = self.post_query(query, {'slug': 'view-org'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['organizationDetail'], {'name': 'View Org'})
+        self.assertEqual(parse_and_validate.cache_info().hits, hits + 1)
+        parse.assert_not_called()
+        view_parse.assert_not_called()
+
+    def test_invalid_query_reports_errors(self):
+        """Test that syntax and validation errors still reach the client as a 400."""
+        for query in ('query {', 'query { organizationDetail { unknownField } }'):
+            with self.subTest(query=query):
+                response = self.post_query(query)
+                self.assertEqual(response.status_code, 400)
+                self.assertTrue(response.json()['errors'])
+
+    def test_get_refuses_mutations(self):
+        """Test that a mutation sent over GET is rejected before it runs."""
+        response = self.client.get(
+            '/graphql/', {'query': 'mutation { createTask(projectId: "1", title: "Via GET") { success } }'}, HTTP_ACCEPT='application/json'
+        )
+        self.assertEqual(response.status_code, 405)